@@ -13,8 +13,9 @@ API Docs:
 """
 
 import asyncio
-import re
+import heapq
 import threading
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -184,13 +185,10 @@ class JobStore:
         return None
 
     def list_all(self, limit: int = 50) -> List[dict]:
+        # Only the newest `limit` jobs are returned, so select them with a
+        # bounded heap instead of sorting the whole store on every request
         with self._lock:
-            jobs = sorted(
-                self._jobs.values(),
-                key=lambda x: x["created_at"],
-                reverse=True
-            )
-            return jobs[:limit]
+            return heapq.nlargest(limit, self._jobs.values(), key=lambda x: x["created_at"])
 
     def delete(self, job_id: str) -> bool:
         with self._lock:
@@ -466,12 +464,16 @@ async def list_job_articles(job_id: str):
     return articles
 
 
+# Characters stripped from user-supplied path components
+_PATH_TRAVERSAL_CHARS = str.maketrans('', '', './\\')
+
+
 def _sanitize_path_component(value: str) -> str:
     """Sanitize a path component to prevent path traversal attacks."""
     # URL decode first
     decoded = unquote(value)
     # Remove any path traversal attempts
-    sanitized = re.sub(r'[./\\]', '', decoded)
+    sanitized = decoded.translate(_PATH_TRAVERSAL_CHARS)
     # Limit length
     return sanitized[:200]
 
@@ -542,7 +544,7 @@ async def generate_sync(request: PipelineRequest):
             detail="Synchronous generation limited to 3 keywords. Use /api/v1/jobs for larger batches."
         )
 
-    output_dir = Path(f"output/api_sync/{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}")
+    output_dir = Path(f"output/api_sync/{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}")
     output_dir.mkdir(parents=True, exist_ok=True)
 
     result = await run_pipeline(
@@ -40,9 +40,10 @@ import importlib.util
 import json
 import logging
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -62,6 +63,7 @@ if str(_BASE_PATH) not in sys.path:
 from shared.models import ArticleOutput
 from shared.html_renderer import HTMLRenderer
 from shared.article_exporter import ArticleExporter
+from shared.json_utils import read_json, write_json
 
 
 def _load_module_from_path(module_name: str, file_path: Path):
@@ -117,12 +119,65 @@ logger = logging.getLogger(__name__)
 # Pipeline Orchestration
 # =============================================================================
 
+def _build_voice_context(company_context) -> Optional[dict]:
+    """
+    Extract the voice fields Stage 3 uses for brand-aligned quality fixes.
+
+    Reads the few fields it needs directly instead of model_dump()-ing the
+    whole voice persona for every article.
+    """
+    voice_persona = company_context.voice_persona
+    if not voice_persona:
+        return None
+
+    # Resolve the field accessor once (dict from JSON input, model otherwise)
+    if isinstance(voice_persona, dict):
+        get = voice_persona.get
+    else:
+        def get(name, default=None):
+            return getattr(voice_persona, name, default)
+
+    lang_style = get("language_style", {})
+    if isinstance(lang_style, dict):
+        formality = lang_style.get("formality", "")
+    else:
+        formality = getattr(lang_style, "formality", "")
+
+    return {
+        "tone": company_context.tone,
+        "banned_words": list(get("banned_words") or []),
+        "do_list": list(get("do_list") or []),
+        "dont_list": list(get("dont_list") or []),
+        "example_phrases": list(get("example_phrases") or []),
+        "formality": formality,
+        "first_person_usage": get("first_person_usage", ""),
+    }
+
+
+def _build_stage2_company(company_context) -> Tuple[CompanyContext, Optional[VisualIdentity]]:
+    """
+    Convert the Stage 1 company context into Stage 2's input models.
+
+    The result only depends on the shared Stage 1 context, so run_pipeline
+    builds it once per batch instead of dumping and re-validating it for
+    every article.
+    """
+    company_ctx = company_context.model_dump()
+    visual_identity_data = company_ctx.pop("visual_identity", None)
+    return (
+        CompanyContext(**company_ctx),
+        VisualIdentity(**visual_identity_data) if visual_identity_data else None,
+    )
+
+
 async def process_single_article(
     context,
     article,
     skip_images: bool = False,
     output_dir: Optional[Path] = None,
     export_formats: Optional[List[str]] = None,
+    stage2_company: Optional[Tuple[CompanyContext, Optional[VisualIdentity]]] = None,
+    voice_context: Optional[dict] = None,
 ) -> dict:
     """
     Process one article through stages 2-5 sequentially.
@@ -135,6 +190,10 @@ async def process_single_article(
         skip_images: Skip image generation in Stage 2
         output_dir: Directory for exported files
         export_formats: List of export formats (html, markdown, json, csv, xlsx, pdf)
+        stage2_company: Prebuilt (CompanyContext, VisualIdentity) for Stage 2;
+            built from context when not given
+        voice_context: Prebuilt Stage 3 voice context; built from context
+            when not given
 
     Returns:
         Dict with article output and metadata
@@ -159,21 +218,22 @@ async def process_single_article(
         logger.info(f"    [Stage 2] Generating article...")
 
         # Extract visual_identity from company_context
-        company_ctx = context.company_context.model_dump()
-        visual_identity_data = company_ctx.pop("visual_identity", None)
+        if stage2_company is None:
+            stage2_company = _build_stage2_company(context.company_context)
+        company_context, visual_identity = stage2_company
 
         stage2_input = Stage2Input(
             keyword=article.keyword,
-            company_context=CompanyContext(**company_ctx),
-            visual_identity=VisualIdentity(**visual_identity_data) if visual_identity_data else None,
+            company_context=company_context,
+            visual_identity=visual_identity,
             language=context.language,
             job_id=context.job_id,
             skip_images=skip_images,
         )
 
         stage2_output = await run_stage_2(stage2_input)
-        # Deep copy to prevent mutation side effects between stages
-        article_dict = copy.deepcopy(stage2_output.article.model_dump())
+        # model_dump() already builds fresh containers, so no deep copy needed
+        article_dict = stage2_output.article.model_dump()
         result["images"] = [img.model_dump() for img in stage2_output.images]
         result["reports"]["stage2"] = {
             "ai_calls": stage2_output.ai_calls,
@@ -187,26 +247,8 @@ async def process_single_article(
         logger.info(f"    [Stage 3] Quality check...")
 
         # Build voice context from Stage 1 for brand-aligned quality fixes
-        voice_context = None
-        voice_persona = context.company_context.voice_persona
-        if voice_persona:
-            # Extract key voice fields for quality checking
-            voice_data = voice_persona if isinstance(voice_persona, dict) else voice_persona.model_dump()
-            lang_style = voice_data.get("language_style", {})
-            if isinstance(lang_style, dict):
-                formality = lang_style.get("formality", "")
-            else:
-                formality = getattr(lang_style, "formality", "")
-
-            voice_context = {
-                "tone": context.company_context.tone,
-                "banned_words": voice_data.get("banned_words", []),
-                "do_list": voice_data.get("do_list", []),
-                "dont_list": voice_data.get("dont_list", []),
-                "example_phrases": voice_data.get("example_phrases", []),
-                "formality": formality,
-                "first_person_usage": voice_data.get("first_person_usage", ""),
-            }
+        if voice_context is None:
+            voice_context = _build_voice_context(context.company_context)
 
         stage3_output = await run_stage_3({
             "article": article_dict,
@@ -295,22 +337,26 @@ async def process_single_article(
         if output_dir:
             logger.info(f"    [Export] Exporting article...")
 
-            # Render HTML
-            html_content = HTMLRenderer.render(
-                article=article_dict,
-                company_name=context.company_context.company_name,
-                company_url=context.company_context.company_url,
-            )
-
-            # Export all formats
             formats = export_formats or ["html", "json"]
             article_output_dir = output_dir / article.slug
-            exported = ArticleExporter.export_all(
-                article=article_dict,
-                html_content=html_content,
-                output_dir=article_output_dir,
-                formats=formats,
-            )
+
+            def render_and_export() -> dict:
+                html_content = HTMLRenderer.render(
+                    article=article_dict,
+                    company_name=context.company_context.company_name,
+                    company_url=context.company_context.company_url,
+                )
+                return ArticleExporter.export_all(
+                    article=article_dict,
+                    html_content=html_content,
+                    output_dir=article_output_dir,
+                    formats=formats,
+                )
+
+            # Rendering is CPU work and file writes / the PDF service call
+            # block, so do both in a worker thread; the event loop stays free
+            # to drive the other articles' Gemini calls in the meantime.
+            exported = await asyncio.to_thread(render_and_export)
 
             result["exported_files"] = exported
             logger.info(f"    [Export] ✓ Exported to {article_output_dir}")
@@ -354,6 +400,7 @@ async def run_pipeline(
         Dict with pipeline results
     """
     start_time = datetime.now()
+    start = time.perf_counter()
     logger.info("=" * 60)
     logger.info("OpenBlog Neo Pipeline")
     logger.info("=" * 60)
@@ -390,6 +437,11 @@ async def run_pipeline(
     # -----------------------------------------
     logger.info("\n[Stages 2-5] Article Processing (parallel)")
 
+    # Stage 2 company models and the Stage 3 voice context are identical
+    # for every article - build once
+    stage2_company = _build_stage2_company(context.company_context)
+    voice_context = _build_voice_context(context.company_context)
+
     # Create tasks for each article
     tasks = [
         process_single_article(
@@ -398,6 +450,8 @@ async def run_pipeline(
             skip_images=skip_images,
             output_dir=output_dir,
             export_formats=export_formats,
+            stage2_company=stage2_company,
+            voice_context=voice_context,
         )
         for article in context.articles
     ]
@@ -435,8 +489,7 @@ async def run_pipeline(
     # -----------------------------------------
     # Collect Results
     # -----------------------------------------
-    end_time = datetime.now()
-    duration = (end_time - start_time).total_seconds()
+    duration = time.perf_counter() - start
 
     successful = sum(1 for r in results if r.get("article") or not r.get("error"))
     failed = sum(1 for r in results if r.get("error"))
@@ -522,13 +575,17 @@ def main():
         default=["html", "json"],
         help="Export formats: html, markdown, json, csv, xlsx, pdf (default: html json)"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the combined output JSON (default: compact; per-article exports are always indented)"
+    )
 
     args = parser.parse_args()
 
     # Get input from file or CLI args
     if args.input:
-        with open(args.input, "r") as f:
-            config = json.load(f)
+        config = read_json(args.input)
         keywords = config.get("keywords", [])
         company_url = config.get("company_url", "")
         language = config.get("language", args.language)
@@ -573,8 +630,9 @@ def main():
             output_path.parent.mkdir(parents=True, exist_ok=True)
             output_file = output_path
 
-        with open(output_file, "w") as f:
-            json.dump(results, f, indent=2)
+        # The combined results file (full context + every article) is read by
+        # tooling, so write it compact unless asked otherwise
+        write_json(output_file, results, pretty=args.pretty)
         logger.info(f"\nOutput saved to: {output_file}")
     else:
         # Print summary to stdout
@@ -5,6 +5,7 @@ Shared components for openblog-neo pipeline.
 - ArticleOutput: Structured blog article schema
 - Constants: Shared configuration
 - Field Utils: Derive field categories from ArticleOutput (DRY)
+- JSON Utils: Fast JSON read/write (orjson when installed)
 """
 
 from .gemini_client import GeminiClient
@@ -18,6 +19,7 @@ from .field_utils import (
     iter_html_fields,
     iter_url_fields,
 )
+from .json_utils import read_json, write_json
 from .article_exporter import ArticleExporter
 from .html_renderer import HTMLRenderer
 
@@ -37,4 +39,7 @@ __all__ = [
     "iter_content_fields",
     "iter_html_fields",
     "iter_url_fields",
+    # JSON utilities
+    "read_json",
+    "write_json",
 ]
@@ -11,16 +11,21 @@ Supports:
 """
 
 import logging
-import json
 import csv
 import os
 import re
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from shared.json_utils import write_json
+except ImportError:
+    from json_utils import write_json
+
 logger = logging.getLogger(__name__)
 
 # PDF service retry configuration
@@ -28,6 +33,16 @@ PDF_MAX_RETRIES = int(os.getenv("PDF_MAX_RETRIES", "3"))
 PDF_BASE_DELAY = float(os.getenv("PDF_BASE_DELAY", "1.0"))
 PDF_MAX_DELAY = float(os.getenv("PDF_MAX_DELAY", "10.0"))
 
+# Fixed patterns, compiled once at import instead of per export
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_BODY_RE = re.compile(r'<body[^>]*>(.*?)</body>', re.DOTALL | re.IGNORECASE)
+_EXTRA_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_WHITESPACE_RE = re.compile(r'\s+')
+_INTER_TAG_SPACE_RE = re.compile(r'>\s+<')
+_SLUG_INVALID_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[-\s]+')
+_IMG_SRC_RE = re.compile(r'<img[^>]+src="([^"]+)"[^>]*>')
+
 
 class ArticleExporter:
     """Export articles in multiple formats."""
@@ -58,61 +73,73 @@ class ArticleExporter:
         headline = article.get("Headline", "article")
         # Strip HTML tags and decode entities
         from html import unescape
-        clean_headline = re.sub(r'<[^>]+>', '', headline)  # Remove HTML tags
+        clean_headline = _HTML_TAG_RE.sub('', headline)  # Remove HTML tags
         clean_headline = unescape(clean_headline)  # Decode HTML entities
         slug = ArticleExporter._generate_slug(clean_headline)
         base_name = slug or "article"
 
-        # Export each format
-        if "html" in formats:
-            html_path = output_dir / f"{base_name}.html"
-            html_path.write_text(html_content, encoding="utf-8")
-            exported_files["html"] = str(html_path)
-            logger.info(f"✅ Exported HTML: {html_path}")
-
-        if "markdown" in formats:
-            try:
-                md_path = output_dir / f"{base_name}.md"
-                md_content = ArticleExporter._html_to_markdown(html_content)
-                md_path.write_text(md_content, encoding="utf-8")
-                exported_files["markdown"] = str(md_path)
-                logger.info(f"✅ Exported Markdown: {md_path}")
-            except Exception as e:
-                logger.warning(f"Markdown export failed: {e}")
-
+        # PDF export is a remote service call with retries; start it in a
+        # worker thread so the local formats are written while it runs
+        pdf_executor = None
+        pdf_future = None
         if "pdf" in formats:
-            try:
-                pdf_path = output_dir / f"{base_name}.pdf"
-                ArticleExporter._html_to_pdf(html_content, pdf_path)
-                exported_files["pdf"] = str(pdf_path)
-                logger.info(f"✅ Exported PDF: {pdf_path}")
-            except Exception as e:
-                logger.warning(f"PDF export failed: {e}")
-
-        if "json" in formats:
-            json_path = output_dir / f"{base_name}.json"
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(article, f, indent=2, ensure_ascii=False)
-            exported_files["json"] = str(json_path)
-            logger.info(f"✅ Exported JSON: {json_path}")
+            pdf_path = output_dir / f"{base_name}.pdf"
+            pdf_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-export")
+            pdf_future = pdf_executor.submit(ArticleExporter._html_to_pdf, html_content, pdf_path)
 
-        if "csv" in formats:
-            try:
-                csv_path = output_dir / f"{base_name}.csv"
-                ArticleExporter._to_csv(article, csv_path)
-                exported_files["csv"] = str(csv_path)
-                logger.info(f"✅ Exported CSV: {csv_path}")
-            except Exception as e:
-                logger.warning(f"CSV export failed: {e}")
-
-        if "xlsx" in formats:
-            try:
-                xlsx_path = output_dir / f"{base_name}.xlsx"
-                ArticleExporter._to_xlsx(article, xlsx_path)
-                exported_files["xlsx"] = str(xlsx_path)
-                logger.info(f"✅ Exported XLSX: {xlsx_path}")
-            except Exception as e:
-                logger.warning(f"XLSX export failed: {e}")
+        try:
+            # Export each format
+            if "html" in formats:
+                html_path = output_dir / f"{base_name}.html"
+                html_path.write_text(html_content, encoding="utf-8")
+                exported_files["html"] = str(html_path)
+                logger.info(f"✅ Exported HTML: {html_path}")
+
+            if "markdown" in formats:
+                try:
+                    md_path = output_dir / f"{base_name}.md"
+                    md_content = ArticleExporter._html_to_markdown(html_content)
+                    md_path.write_text(md_content, encoding="utf-8")
+                    exported_files["markdown"] = str(md_path)
+                    logger.info(f"✅ Exported Markdown: {md_path}")
+                except Exception as e:
+                    logger.warning(f"Markdown export failed: {e}")
+
+            if "json" in formats:
+                json_path = output_dir / f"{base_name}.json"
+                write_json(json_path, article)
+                exported_files["json"] = str(json_path)
+                logger.info(f"✅ Exported JSON: {json_path}")
+
+            if "csv" in formats:
+                try:
+                    csv_path = output_dir / f"{base_name}.csv"
+                    ArticleExporter._to_csv(article, csv_path)
+                    exported_files["csv"] = str(csv_path)
+                    logger.info(f"✅ Exported CSV: {csv_path}")
+                except Exception as e:
+                    logger.warning(f"CSV export failed: {e}")
+
+            if "xlsx" in formats:
+                try:
+                    xlsx_path = output_dir / f"{base_name}.xlsx"
+                    ArticleExporter._to_xlsx(article, xlsx_path)
+                    exported_files["xlsx"] = str(xlsx_path)
+                    logger.info(f"✅ Exported XLSX: {xlsx_path}")
+                except Exception as e:
+                    logger.warning(f"XLSX export failed: {e}")
+
+            if pdf_future is not None:
+                try:
+                    pdf_future.result()
+                    exported_files["pdf"] = str(pdf_path)
+                    logger.info(f"✅ Exported PDF: {pdf_path}")
+                except Exception as e:
+                    logger.warning(f"PDF export failed: {e}")
+        finally:
+            # Always reap the PDF worker, even if a local export raised
+            if pdf_executor is not None:
+                pdf_executor.shutdown(wait=True)
 
         return exported_files
 
@@ -130,7 +157,7 @@ class ArticleExporter:
         from markdownify import markdownify as md
 
         # Extract body content if full HTML document
-        body_match = re.search(r'<body[^>]*>(.*?)</body>', html_content, re.DOTALL | re.IGNORECASE)
+        body_match = _BODY_RE.search(html_content)
         if body_match:
             html_content = body_match.group(1)
 
@@ -138,7 +165,7 @@ class ArticleExporter:
         result = md(html_content, heading_style="ATX", strip=['style', 'script'])
 
         # Clean up extra whitespace
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        result = _EXTRA_BLANK_LINES_RE.sub('\n\n', result)
 
         return result.strip()
 
@@ -251,8 +278,6 @@ class ArticleExporter:
         Returns:
             HTML with base64 data URLs
         """
-        import re
-        
         def replace_image_src(match):
             img_tag = match.group(0)
             src = match.group(1)
@@ -305,8 +330,7 @@ class ArticleExporter:
                 return img_tag
         
         # Find and replace all image src attributes
-        pattern = r'<img[^>]+src="([^"]+)"[^>]*>'
-        modified_html = re.sub(pattern, replace_image_src, html_content)
+        modified_html = _IMG_SRC_RE.sub(replace_image_src, html_content)
         
         return modified_html
 
@@ -321,8 +345,6 @@ class ArticleExporter:
         Returns:
             HTML with PDF margin CSS added
         """
-        import re
-        
         # CSS for PDF margins
         pdf_margin_css = """
         @page {
@@ -338,7 +360,7 @@ class ArticleExporter:
             html_content = html_content.replace('</head>', f'<style>{pdf_margin_css}</style></head>')
         elif '<style>' in html_content:
             # Insert before first </style> tag
-            html_content = re.sub(r'(</style>)', f'{pdf_margin_css}\\1', html_content, count=1)
+            html_content = html_content.replace('</style>', f'{pdf_margin_css}</style>', 1)
         else:
             # Insert before </head> or at start of <body>
             if '</head>' in html_content:
@@ -497,8 +519,8 @@ class ArticleExporter:
         
         # Remove newlines and extra whitespace between tags
         # Keep single space between tags and text
-        single_line = re.sub(r'\s+', ' ', html_content)  # Replace all whitespace with single space
-        single_line = re.sub(r'>\s+<', '><', single_line)  # Remove spaces between tags
+        single_line = _WHITESPACE_RE.sub(' ', html_content)  # Replace all whitespace with single space
+        single_line = _INTER_TAG_SPACE_RE.sub('><', single_line)  # Remove spaces between tags
         single_line = single_line.strip()
         
         return single_line
@@ -509,7 +531,7 @@ class ArticleExporter:
         if not text:
             return ""
         slug = text.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = _SLUG_INVALID_RE.sub('', slug)
+        slug = _SLUG_SEPARATOR_RE.sub('-', slug)
         return slug.strip('-')
 
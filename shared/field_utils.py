@@ -5,8 +5,10 @@ Single source of truth: All stages use these helpers instead of hardcoded lists.
 Stage 2 defines the schema, Stages 3-5 derive their field lists from it.
 """
 
+from functools import lru_cache
 from typing import List, Set, Iterator, Tuple, Any, Dict
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -46,14 +48,17 @@ _HTML_FIELD_PATTERNS = (
     '_content',      # section_XX_content
 )
 
+# Block tags that mark a field as HTML content (one scan instead of three `in` checks)
+_HTML_BLOCK_TAG = re.compile(r'<(?:p|ul|ol)>')
+
 # Fields to skip for URL extraction (unlikely to have URLs)
-_SKIP_URL_EXTRACTION = {
+_SKIP_URL_EXTRACTION = frozenset({
     'Headline',
     'Meta_Title',
     'Meta_Description',
     'Search_Queries',
     'created_at',
-}
+})
 
 
 def get_all_text_fields() -> List[str]:
@@ -148,6 +153,28 @@ def get_url_extraction_fields() -> List[str]:
     return url_fields
 
 
+# =============================================================================
+# Cached Field Tuples (model fields are fixed at import time)
+# =============================================================================
+
+@lru_cache(maxsize=1)
+def _content_fields() -> Tuple[str, ...]:
+    """Get content fields as a tuple (cached, thread-safe)."""
+    return tuple(get_content_fields())
+
+
+@lru_cache(maxsize=1)
+def _html_content_fields() -> Tuple[str, ...]:
+    """Get HTML content fields as a tuple (cached, thread-safe)."""
+    return tuple(get_html_content_fields())
+
+
+@lru_cache(maxsize=1)
+def _url_extraction_fields() -> Tuple[str, ...]:
+    """Get URL extraction fields as a tuple (cached, thread-safe)."""
+    return tuple(get_url_extraction_fields())
+
+
 # =============================================================================
 # Field Iterators (for use with article dicts)
 # =============================================================================
@@ -159,7 +186,7 @@ def iter_content_fields(article: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
     Yields:
         (field_name, content) tuples for non-empty text fields
     """
-    for field in get_content_fields():
+    for field in _content_fields():
         content = article.get(field, "")
         # Check stripped length to reject whitespace-only strings
         if content and isinstance(content, str) and len(content.strip()) > 10:
@@ -175,12 +202,12 @@ def iter_html_fields(article: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
     Yields:
         (field_name, content) tuples for HTML content fields
     """
-    for field in get_html_content_fields():
+    for field in _html_content_fields():
         content = article.get(field, "")
         if not content or not isinstance(content, str):
             continue
         # Verify it has HTML tags
-        if '<p>' in content or '<ul>' in content or '<ol>' in content:
+        if _HTML_BLOCK_TAG.search(content):
             yield field, content
 
 
@@ -191,7 +218,7 @@ def iter_url_fields(article: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
     Yields:
         (field_name, content) tuples for URL-bearing fields
     """
-    for field in get_url_extraction_fields():
+    for field in _url_extraction_fields():
         content = article.get(field, "")
         if content and isinstance(content, str):
             yield field, content
@@ -201,25 +228,23 @@ def iter_url_fields(article: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
 # Field Sets (cached for performance - thread-safe using functools.lru_cache)
 # =============================================================================
 
-from functools import lru_cache
-
 
 @lru_cache(maxsize=1)
 def _get_content_fields_set() -> frozenset:
     """Get content fields as a frozen set (cached, thread-safe)."""
-    return frozenset(get_content_fields())
+    return frozenset(_content_fields())
 
 
 @lru_cache(maxsize=1)
 def _get_html_fields_set() -> frozenset:
     """Get HTML fields as a frozen set (cached, thread-safe)."""
-    return frozenset(get_html_content_fields())
+    return frozenset(_html_content_fields())
 
 
 @lru_cache(maxsize=1)
 def _get_url_fields_set() -> frozenset:
     """Get URL fields as a frozen set (cached, thread-safe)."""
-    return frozenset(get_url_extraction_fields())
+    return frozenset(_url_extraction_fields())
 
 
 def is_content_field(field_name: str) -> bool:
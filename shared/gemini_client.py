@@ -14,8 +14,8 @@ import asyncio
 import json
 import logging
 import os
-import re
 import random
+import re
 from typing import Dict, Any, Optional, Union, List, Tuple
 from pathlib import Path
 
@@ -24,12 +24,24 @@ import httpx
 from dotenv import load_dotenv
 
 from .constants import GEMINI_MODEL, GEMINI_TIMEOUT_GROUNDING, GEMINI_TIMEOUT_DEFAULT
+from .json_utils import loads
 
 # Default retry configuration
 DEFAULT_MAX_RETRIES = 4  # Increased for grounding operations that may take longer
 DEFAULT_BASE_DELAY = 1.0  # seconds
 DEFAULT_MAX_DELAY = 30.0  # seconds
 
+# Error message fragments that mark a failure as transient (rate limit, server
+# errors, network issues) - matched in one case-insensitive pass
+_RETRYABLE_ERROR_RE = re.compile(
+    "|".join(re.escape(x) for x in [
+        'rate limit', '429', '500', '502', '503', '504',
+        'overloaded', 'quota', 'temporarily unavailable',
+        'connection', 'timeout', 'resource exhausted'
+    ]),
+    re.IGNORECASE,
+)
+
 # Load .env from openblog-neo root (override=True ensures .env takes precedence over shell env vars)
 load_dotenv(Path(__file__).parent.parent / ".env", override=True)
 
@@ -198,12 +210,7 @@ class GeminiClient:
             except Exception as e:
                 last_error = e
                 # Check if error is retryable (rate limit, server errors, transient network issues)
-                error_str = str(e).lower()
-                is_retryable = any(x in error_str for x in [
-                    'rate limit', '429', '500', '502', '503', '504',
-                    'overloaded', 'quota', 'temporarily unavailable',
-                    'connection', 'timeout', 'resource exhausted'
-                ])
+                is_retryable = _RETRYABLE_ERROR_RE.search(str(e)) is not None
 
                 if not is_retryable or attempt >= self.max_retries:
                     logger.error(f"Gemini generation failed: {e}")
@@ -235,30 +242,31 @@ class GeminiClient:
         Raises:
             ValueError: If JSON cannot be parsed
         """
-        # Extract JSON from markdown if present
-        if "```json" in text:
-            parts = text.split("```json")
-            if len(parts) > 1:
-                inner_parts = parts[1].split("```")
-                text = inner_parts[0].strip()
-            # else: no valid ```json block, continue with original text
-        elif "```" in text:
-            parts = text.split("```")
-            if len(parts) > 1:
-                text = parts[1].split("```")[0].strip()
-            # else: no valid ``` block, continue with original text
+        # Extract JSON from markdown if present (slice between fences rather
+        # than splitting the whole response into a list of parts)
+        fence = text.find("```json")
+        fence_len = 7
+        if fence == -1:
+            fence = text.find("```")
+            fence_len = 3
+        if fence != -1:
+            start = fence + fence_len
+            end = text.find("```", start)
+            text = (text[start:end] if end != -1 else text[start:]).strip()
 
         # Find JSON object start
         if not text.startswith("{"):
-            match = re.search(r'\{', text)
-            if match:
-                text = text[match.start():]
+            start = text.find("{")
+            if start != -1:
+                text = text[start:]
             else:
                 raise ValueError(f"Could not find JSON in response: {text[:200]}")
 
-        # Try parsing directly first - handles strings with braces correctly
+        # Try parsing directly first - handles strings with braces correctly.
+        # orjson when installed (its decode error subclasses JSONDecodeError);
+        # the stdlib parse below stays as the lenient fallback (NaN etc.)
         try:
-            return json.loads(text)
+            return loads(text)
         except json.JSONDecodeError:
             pass
 
@@ -343,10 +351,12 @@ class GeminiClient:
                     redirect_url = chunk.web.uri
                     title = chunk.web.title if hasattr(chunk.web, 'title') and chunk.web.title else ""
 
-                    # Follow redirect to get real URL and validate status
+                    # Follow redirect to get real URL and validate status.
+                    # Only the final URL and status are needed, so stream the
+                    # response and close it without downloading the page body.
                     try:
-                        resp = await client.get(redirect_url)
-                        real_url = str(resp.url)
+                        async with client.stream("GET", redirect_url) as resp:
+                            real_url = str(resp.url)
 
                         # Only include URLs that return 200-299 (success)
                         if resp.status_code < 200 or resp.status_code >= 300:
@@ -494,12 +504,7 @@ class GeminiClient:
             except Exception as e:
                 last_error = e
                 # Check if error is retryable
-                error_str = str(e).lower()
-                is_retryable = any(x in error_str for x in [
-                    'rate limit', '429', '500', '502', '503', '504',
-                    'overloaded', 'quota', 'temporarily unavailable',
-                    'connection', 'timeout', 'resource exhausted'
-                ])
+                is_retryable = _RETRYABLE_ERROR_RE.search(str(e)) is not None
 
                 if not is_retryable or attempt >= self.max_retries:
                     logger.error(f"Gemini schema generation failed: {e}")
@@ -17,6 +17,41 @@ logger = logging.getLogger(__name__)
 class HTMLRenderer:
     """Simple HTML renderer - no content manipulation."""
 
+    # Sanitization patterns, precompiled once. The passes must run one
+    # construct at a time in this order: removing one construct can splice
+    # its neighbours into a new tag (e.g. "<ifr<script></script>ame>"), and
+    # later passes are what catch those
+    _SCRIPT_PATTERN = re.compile(r'<script[^>]*>.*?</script>', re.IGNORECASE | re.DOTALL)
+    _STYLE_PATTERN = re.compile(r'<style[^>]*>.*?</style>', re.IGNORECASE | re.DOTALL)
+    _EVENT_HANDLER_QUOTED_PATTERN = re.compile(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', re.IGNORECASE)
+    _EVENT_HANDLER_UNQUOTED_PATTERN = re.compile(r'\s*on\w+\s*=\s*\S+', re.IGNORECASE)
+    _SANITIZE_PASSES = (
+        (_SCRIPT_PATTERN, ''),
+        (_STYLE_PATTERN, ''),
+        # iframe tags (can embed malicious content)
+        (re.compile(r'<iframe[^>]*>.*?</iframe>', re.IGNORECASE | re.DOTALL), ''),
+        (re.compile(r'<iframe[^>]*/>', re.IGNORECASE), ''),
+        # object/embed tags (can embed Flash/plugins)
+        (re.compile(r'<object[^>]*>.*?</object>', re.IGNORECASE | re.DOTALL), ''),
+        (re.compile(r'<embed[^>]*/?>', re.IGNORECASE), ''),
+        # form tags (prevent phishing)
+        (re.compile(r'<form[^>]*>.*?</form>', re.IGNORECASE | re.DOTALL), ''),
+        # event handlers (onclick, onload, onerror, etc.)
+        (_EVENT_HANDLER_QUOTED_PATTERN, ''),
+        (_EVENT_HANDLER_UNQUOTED_PATTERN, ''),
+        # javascript: URLs
+        (re.compile(r'href\s*=\s*["\']javascript:[^"\']*["\']', re.IGNORECASE), 'href="#"'),
+        (re.compile(r'src\s*=\s*["\']javascript:[^"\']*["\']', re.IGNORECASE), 'src=""'),
+        # data: URLs (can contain executable content; images allowed in src)
+        (re.compile(r'href\s*=\s*["\']data:[^"\']*["\']', re.IGNORECASE), 'href="#"'),
+        (re.compile(r'src\s*=\s*["\']data:(?!image/)[^"\']*["\']', re.IGNORECASE), 'src=""'),
+        # base tags (can hijack relative URLs)
+        (re.compile(r'<base[^>]*/?>', re.IGNORECASE), ''),
+        # meta refresh (can redirect)
+        (re.compile(r'<meta[^>]*http-equiv\s*=\s*["\']refresh["\'][^>]*/?>', re.IGNORECASE), ''),
+    )
+    _TAG_PATTERN = re.compile(r'<[^>]+>')
+
     @staticmethod
     def render(
         article: Dict[str, Any],
@@ -203,31 +238,9 @@ class HTMLRenderer:
         if not html:
             return ""
 
-        # Remove script tags and content
-        sanitized = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.IGNORECASE | re.DOTALL)
-        # Remove style tags and content
-        sanitized = re.sub(r'<style[^>]*>.*?</style>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-        # Remove iframe tags (can embed malicious content)
-        sanitized = re.sub(r'<iframe[^>]*>.*?</iframe>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-        sanitized = re.sub(r'<iframe[^>]*/>', '', sanitized, flags=re.IGNORECASE)
-        # Remove object/embed tags (can embed Flash/plugins)
-        sanitized = re.sub(r'<object[^>]*>.*?</object>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-        sanitized = re.sub(r'<embed[^>]*/?>', '', sanitized, flags=re.IGNORECASE)
-        # Remove form tags (prevent phishing)
-        sanitized = re.sub(r'<form[^>]*>.*?</form>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-        # Remove event handlers (onclick, onload, onerror, etc.)
-        sanitized = re.sub(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', '', sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r'\s*on\w+\s*=\s*\S+', '', sanitized, flags=re.IGNORECASE)
-        # Remove javascript: URLs
-        sanitized = re.sub(r'href\s*=\s*["\']javascript:[^"\']*["\']', 'href="#"', sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r'src\s*=\s*["\']javascript:[^"\']*["\']', 'src=""', sanitized, flags=re.IGNORECASE)
-        # Remove data: URLs (can contain executable content)
-        sanitized = re.sub(r'href\s*=\s*["\']data:[^"\']*["\']', 'href="#"', sanitized, flags=re.IGNORECASE)
-        sanitized = re.sub(r'src\s*=\s*["\']data:(?!image/)[^"\']*["\']', 'src=""', sanitized, flags=re.IGNORECASE)
-        # Remove base tags (can hijack relative URLs)
-        sanitized = re.sub(r'<base[^>]*/?>', '', sanitized, flags=re.IGNORECASE)
-        # Remove meta refresh (can redirect)
-        sanitized = re.sub(r'<meta[^>]*http-equiv\s*=\s*["\']refresh["\'][^>]*/?>', '', sanitized, flags=re.IGNORECASE)
+        sanitized = html
+        for pattern, replacement in HTMLRenderer._SANITIZE_PASSES:
+            sanitized = pattern.sub(replacement, sanitized)
 
         return sanitized
 
@@ -268,10 +281,11 @@ class HTMLRenderer:
             if title:
                 anchor = f"section-{i}"
                 clean_title = HTMLRenderer._strip_html(title)
-                # Shorten for TOC (max 6 words)
-                words = clean_title.split()[:6]
-                short_title = ' '.join(words)
-                if len(words) < len(clean_title.split()):
+                # Shorten for TOC (max 6 words); a 7th item means more words
+                # follow, so there is no need to split the whole title
+                words = clean_title.split(maxsplit=6)
+                short_title = ' '.join(words[:6])
+                if len(words) > 6:
                     short_title += "..."
                 items.append(f'<li><a href="#{anchor}">{escape(short_title)}</a></li>')
 
@@ -375,10 +389,10 @@ class HTMLRenderer:
         if '<ol>' in sources or '<li>' in sources:
             # Strip potentially dangerous tags but keep structure
             # Remove script, style, and event handlers
-            sanitized = re.sub(r'<script[^>]*>.*?</script>', '', sources, flags=re.IGNORECASE | re.DOTALL)
-            sanitized = re.sub(r'<style[^>]*>.*?</style>', '', sanitized, flags=re.IGNORECASE | re.DOTALL)
-            sanitized = re.sub(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', '', sanitized, flags=re.IGNORECASE)
-            sanitized = re.sub(r'\s*on\w+\s*=\s*\S+', '', sanitized, flags=re.IGNORECASE)
+            sanitized = HTMLRenderer._SCRIPT_PATTERN.sub('', sources)
+            sanitized = HTMLRenderer._STYLE_PATTERN.sub('', sanitized)
+            sanitized = HTMLRenderer._EVENT_HANDLER_QUOTED_PATTERN.sub('', sanitized)
+            sanitized = HTMLRenderer._EVENT_HANDLER_UNQUOTED_PATTERN.sub('', sanitized)
             return f"""<section class="sources">
                 <h2>Sources</h2>
                 {sanitized}
@@ -422,10 +436,10 @@ class HTMLRenderer:
                 continue
 
             header_html = ''.join(f'<th>{escape(h)}</th>' for h in headers)
-            rows_html = ''
-            for row in rows:
-                cells = ''.join(f'<td>{escape(str(c))}</td>' for c in row)
-                rows_html += f'<tr>{cells}</tr>'
+            rows_html = ''.join(
+                '<tr>' + ''.join(f'<td>{escape(str(c))}</td>' for c in row) + '</tr>'
+                for row in rows
+            )
 
             parts.append(f'''<div class="comparison-table">
                 <h3>{escape(title)}</h3>
@@ -442,5 +456,5 @@ class HTMLRenderer:
         """Strip HTML tags and decode entities."""
         if not text:
             return ""
-        clean = re.sub(r'<[^>]+>', '', str(text))
+        clean = HTMLRenderer._TAG_PATTERN.sub('', str(text))
         return unescape(clean).strip()
@@ -0,0 +1,98 @@
+"""
+JSON Utilities - Fast JSON serialization for pipeline artifacts.
+
+Uses orjson (C encoder/decoder) when installed, falls back to the stdlib
+json module otherwise. Output is always UTF-8, either pretty-printed with
+2-space indentation or compact with no whitespace, and is byte-identical
+regardless of which backend wrote it.
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from pathlib import Path, PurePath
+from typing import Any, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
+try:
+    from pydantic import BaseModel
+except ImportError:
+    BaseModel = None
+
+
+def to_jsonable(obj: Any) -> Any:
+    """
+    Convert obj into plain JSON-ready Python values in a single walk.
+
+    Pydantic models become dicts, paths become strings and dates become ISO
+    strings, so the encoder never needs a per-object ``default`` callback.
+    Any other type raises TypeError, like json.dumps without ``default``.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, dict):
+        return {k if isinstance(k, str) else str(k): to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [to_jsonable(v) for v in obj]
+    if BaseModel is not None and isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON bytes.
+
+    Args:
+        obj: JSON-serializable object
+        pretty: Pretty-print with 2-space indentation (compact otherwise)
+
+    Returns:
+        Encoded JSON document
+    """
+    if _ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Paths / models somewhere in the tree: sanitize once and retry
+            return orjson.dumps(to_jsonable(obj), option=option)
+
+    # Explicit separators match orjson: no spaces in compact output
+    return json.dumps(
+        to_jsonable(obj),
+        indent=2 if pretty else None,
+        separators=(",", ": ") if pretty else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: Union[str, Path], obj: Any, pretty: bool = True) -> None:
+    """Serialize obj and write the encoded bytes to path (no text-layer re-encoding)."""
+    Path(path).write_bytes(dumps(obj, pretty=pretty))
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file from its raw bytes."""
+    return loads(Path(path).read_bytes())
@@ -5,6 +5,7 @@ ArticleOutput: Complete structured blog article schema (40+ fields).
 Created in Stage 2, mutated in Stages 3-5.
 """
 
+from operator import attrgetter
 from typing import Optional, Dict, List, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import logging
@@ -12,6 +13,11 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Fetch all numbered title/question fields in one C-level call each
+_SECTION_TITLES = attrgetter(*(f"section_{i:02d}_title" for i in range(1, 10)))
+_FAQ_QUESTIONS = attrgetter(*(f"faq_{i:02d}_question" for i in range(1, 7)))
+_PAA_QUESTIONS = attrgetter(*(f"paa_{i:02d}_question" for i in range(1, 5)))
+
 
 class Source(BaseModel):
     """A citation source with title and URL."""
@@ -276,25 +282,15 @@ class ArticleOutput(BaseModel):
 
     def get_active_sections(self) -> int:
         """Count non-empty section titles."""
-        sections = [
-            self.section_01_title, self.section_02_title, self.section_03_title,
-            self.section_04_title, self.section_05_title, self.section_06_title,
-            self.section_07_title, self.section_08_title, self.section_09_title,
-        ]
-        return sum(1 for s in sections if s and s.strip())
+        return sum(1 for s in _SECTION_TITLES(self) if s and s.strip())
 
     def get_active_faqs(self) -> int:
         """Count non-empty FAQ questions."""
-        faqs = [
-            self.faq_01_question, self.faq_02_question, self.faq_03_question,
-            self.faq_04_question, self.faq_05_question, self.faq_06_question,
-        ]
-        return sum(1 for f in faqs if f and f.strip())
+        return sum(1 for f in _FAQ_QUESTIONS(self) if f and f.strip())
 
     def get_active_paas(self) -> int:
         """Count non-empty PAA questions."""
-        paas = [self.paa_01_question, self.paa_02_question, self.paa_03_question, self.paa_04_question]
-        return sum(1 for p in paas if p and p.strip())
+        return sum(1 for p in _PAA_QUESTIONS(self) if p and p.strip())
 
     # Alias methods for backward compatibility with stage 2/article_schema.py naming
     def count_sections(self) -> int:
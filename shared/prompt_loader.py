@@ -17,16 +17,22 @@ Usage:
 import logging
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Project root
 _ROOT = Path(__file__).parent.parent
+# Resolved once; the project root does not move while the process runs
+_ROOT_RESOLVED = str(_ROOT.resolve())
 
 # Valid stage names (whitelist for security)
 _VALID_STAGES = {"stage1", "stage2", "stage3", "stage4", "stage5", "stage_refresh", "shared"}
 
+# Raw prompt text keyed by path, reused while the file's mtime is unchanged
+# (edited prompts are still picked up without a restart)
+_PROMPT_CACHE: Dict[Path, Tuple[int, str]] = {}
+
 
 def _validate_path_component(name: str, component_type: str) -> str:
     """
@@ -95,15 +101,14 @@ def load_prompt(
 
     # Resolve to absolute path and verify it's within _ROOT
     resolved_path = prompt_path.resolve()
-    resolved_root = _ROOT.resolve()
-    if not str(resolved_path).startswith(str(resolved_root)):
+    if not str(resolved_path).startswith(_ROOT_RESOLVED):
         raise ValueError(f"Invalid path: access outside project root not allowed")
 
-    if not prompt_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-
-    # Read prompt
-    prompt = prompt_path.read_text(encoding="utf-8")
+    # Read prompt; its stat() doubles as the existence check
+    try:
+        prompt = _read_prompt(prompt_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from None
 
     # Format placeholders if requested
     if format and kwargs:
@@ -116,6 +121,18 @@ def load_prompt(
     return prompt
 
 
+def _read_prompt(prompt_path: Path) -> str:
+    """Return the prompt file's text, re-reading it only when it has changed."""
+    mtime = prompt_path.stat().st_mtime_ns
+    cached = _PROMPT_CACHE.get(prompt_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    text = prompt_path.read_text(encoding="utf-8")
+    _PROMPT_CACHE[prompt_path] = (mtime, text)
+    return text
+
+
 def _safe_format(template: str, values: Dict[str, Any]) -> str:
     """
     Format template with values, leaving unknown placeholders intact.
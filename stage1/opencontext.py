@@ -8,7 +8,6 @@ Uses shared GeminiClient for consistency across all stages.
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
@@ -322,7 +321,7 @@ if __name__ == "__main__":
 
     async def main():
         context, ai_called = await get_company_context(url)
-        print(json.dumps(context.model_dump(), indent=2))
+        print(context.model_dump_json(indent=2))
         print(f"\nAI called: {ai_called}")
 
     asyncio.run(main())
@@ -125,6 +125,40 @@ BLOG_PATH_PATTERNS = [
 ]
 
 
+def _compile_any(patterns: List[str]) -> re.Pattern:
+    """Compile a pattern list into one alternation (matches if any pattern matches)."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Precompiled alternations - classification runs per URL across whole sitemaps,
+# so each list is checked in a single scan instead of one search per pattern
+_BLOG_PATH_RE = _compile_any(BLOG_PATH_PATTERNS)
+_LOCATION_PAGE_RE = _compile_any(LOCATION_PAGE_PATTERNS)
+_BLOG_TITLE_RE = _compile_any(BLOG_TITLE_PATTERNS)
+_TOOL_TITLE_RE = _compile_any(TOOL_TITLE_PATTERNS)
+
+# Tool keyword matcher for compound path segments, built once at import.
+# Longest keywords first so the alternation prefers the most specific match.
+_TOOL_KEYWORD_ALTERNATION = "|".join(
+    re.escape(kw) for kw in sorted(TOOL_KEYWORDS, key=len, reverse=True)
+)
+_TOOL_KEYWORD_RE = re.compile(_TOOL_KEYWORD_ALTERNATION)
+_TOOL_KEYWORD_SUFFIX_RE = re.compile(f"(?:{_TOOL_KEYWORD_ALTERNATION})$")
+
+# Page metadata extraction
+_FILE_EXT_RE = re.compile(r'\.[a-z]{2,4}$', re.IGNORECASE)
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]+)</title>', re.IGNORECASE)
+_META_DESC_RE = re.compile(
+    r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']',
+    re.IGNORECASE
+)
+_META_DESC_ALT_RE = re.compile(
+    r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']description["\']',
+    re.IGNORECASE
+)
+_H1_RE = re.compile(r'<h1[^>]*>([^<]+)</h1>', re.IGNORECASE)
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -324,17 +358,16 @@ class SmartClassifier:
 
         for entry in entries:
             score = URLScore(url=entry.url)
-            path = "/" + "/".join(entry.path_segments) + ("/" if entry.path_segments else "")
-            path_lower = path.lower()
+            # Lowercase once per URL; segments are reused by several checks below
+            segments_lower = [segment.lower() for segment in entry.path_segments]
+            path_lower = "/" + "/".join(segments_lower) + ("/" if segments_lower else "")
 
             # Check for explicit blog path patterns FIRST - these are ALWAYS blogs
             has_blog_pattern = False
-            for pattern in BLOG_PATH_PATTERNS:
-                if re.search(pattern, path_lower, re.IGNORECASE):
-                    score.blog_score += 2.0  # Strong override - always a blog
-                    score.signals["blog_path_pattern"] = 2.0
-                    has_blog_pattern = True
-                    break
+            if _BLOG_PATH_RE.search(path_lower):
+                score.blog_score += 2.0  # Strong override - always a blog
+                score.signals["blog_path_pattern"] = 2.0
+                has_blog_pattern = True
 
             # If has blog pattern, skip other checks - it's definitely a blog
             if has_blog_pattern:
@@ -343,18 +376,15 @@ class SmartClassifier:
 
             # Check for location page patterns (these are NOT blog posts)
             is_location_page = False
-            for pattern in LOCATION_PAGE_PATTERNS:
-                if re.search(pattern, path_lower, re.IGNORECASE):
-                    score.tool_score += 0.6  # Strong signal - push to "other"
-                    score.signals["location_page"] = 0.6
-                    is_location_page = True
-                    break
+            if _LOCATION_PAGE_RE.search(path_lower):
+                score.tool_score += 0.6  # Strong signal - push to "other"
+                score.signals["location_page"] = 0.6
+                is_location_page = True
 
             # Check for legal/static page keywords (these should never be blogs)
             is_legal = False
             if not is_location_page:
-                for segment in entry.path_segments:
-                    segment_lower = segment.lower()
+                for segment_lower in segments_lower:
                     if segment_lower in LEGAL_KEYWORDS:
                         score.tool_score += 0.5  # Use tool_score to push to "other"
                         score.signals["legal_keyword"] = 0.5
@@ -363,23 +393,19 @@ class SmartClassifier:
 
             # Check for tool keywords in path
             if not is_legal and not is_location_page:
-                for segment in entry.path_segments:
-                    segment_lower = segment.lower()
+                for segment_lower in segments_lower:
                     if segment_lower in TOOL_KEYWORDS:
                         score.tool_score += 0.5
                         score.signals["tool_keyword"] = 0.5
                         break
                     # Partial match for compound words - stronger if at end (suffix)
-                    for kw in TOOL_KEYWORDS:
-                        if kw in segment_lower:
-                            # Suffix match (e.g., "baufinanzierungsrechner" ends with "rechner")
-                            if segment_lower.endswith(kw):
-                                score.tool_score += 0.5
-                                score.signals["tool_keyword_suffix"] = 0.5
-                            else:
-                                score.tool_score += 0.25
-                                score.signals["tool_keyword_partial"] = 0.25
-                            break
+                    # Suffix match (e.g., "baufinanzierungsrechner" ends with "rechner")
+                    if _TOOL_KEYWORD_SUFFIX_RE.search(segment_lower):
+                        score.tool_score += 0.5
+                        score.signals["tool_keyword_suffix"] = 0.5
+                    elif _TOOL_KEYWORD_RE.search(segment_lower):
+                        score.tool_score += 0.25
+                        score.signals["tool_keyword_partial"] = 0.25
 
             # Slug length analysis - HARD REQUIREMENT for blog detection (when no blog pattern)
             # Long slugs like "can-i-get-a-credit-loan-to-increase-my-affordability" are blogs
@@ -388,7 +414,7 @@ class SmartClassifier:
             if entry.path_segments:
                 last_segment = entry.path_segments[-1]
                 # Remove file extension if present
-                slug = re.sub(r'\.[a-z]{2,4}$', '', last_segment, flags=re.IGNORECASE)
+                slug = _FILE_EXT_RE.sub('', last_segment)
                 slug_length = len(slug)
 
                 if slug_length >= MIN_BLOG_SLUG_LENGTH:
@@ -402,7 +428,7 @@ class SmartClassifier:
                     score.signals["short_slug_disqualifier"] = 1.0
 
             # Language prefix at depth 1 suggests content page (weak signal)
-            if entry.path_depth >= 2 and entry.path_segments[0].lower() in LANGUAGE_PREFIXES:
+            if entry.path_depth >= 2 and segments_lower[0] in LANGUAGE_PREFIXES:
                 score.blog_score += 0.05
                 score.signals["lang_prefix"] = 0.05
 
@@ -513,56 +539,51 @@ class SmartClassifier:
         results = {}
         semaphore = asyncio.Semaphore(5)
 
-        async def fetch_meta(url: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        async def fetch_meta(
+            client: httpx.AsyncClient, url: str
+        ) -> Optional[Tuple[str, Dict[str, str]]]:
             async with semaphore:
                 try:
-                    async with httpx.AsyncClient(
-                        timeout=Timeout(connect=3.0, read=self.fetch_timeout),
-                        follow_redirects=True,
-                        limits=Limits(max_connections=10)
-                    ) as client:
-                        response = await client.get(url)
-                        if response.status_code != 200:
-                            return None
-
-                        html = response.text[:50000]  # Limit to first 50KB
-
-                        # Extract title
-                        title_match = re.search(
-                            r'<title[^>]*>([^<]+)</title>',
-                            html, re.IGNORECASE
-                        )
-                        title = title_match.group(1).strip() if title_match else ""
-
-                        # Extract meta description
-                        desc_match = re.search(
-                            r'<meta[^>]+name=["\']description["\'][^>]+content=["\']([^"\']+)["\']',
-                            html, re.IGNORECASE
-                        )
-                        if not desc_match:
-                            desc_match = re.search(
-                                r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+name=["\']description["\']',
-                                html, re.IGNORECASE
-                            )
-                        description = desc_match.group(1).strip() if desc_match else ""
-
-                        # Extract h1
-                        h1_match = re.search(r'<h1[^>]*>([^<]+)</h1>', html, re.IGNORECASE)
-                        h1 = h1_match.group(1).strip() if h1_match else ""
-
-                        return url, {
-                            "title": title,
-                            "description": description,
-                            "h1": h1,
-                        }
+                    response = await client.get(url)
+                    if response.status_code != 200:
+                        return None
+
+                    html = response.text[:50000]  # Limit to first 50KB
+
+                    # Extract title
+                    title_match = _TITLE_RE.search(html)
+                    title = title_match.group(1).strip() if title_match else ""
+
+                    # Extract meta description
+                    desc_match = _META_DESC_RE.search(html)
+                    if not desc_match:
+                        desc_match = _META_DESC_ALT_RE.search(html)
+                    description = desc_match.group(1).strip() if desc_match else ""
+
+                    # Extract h1
+                    h1_match = _H1_RE.search(html)
+                    h1 = h1_match.group(1).strip() if h1_match else ""
+
+                    return url, {
+                        "title": title,
+                        "description": description,
+                        "h1": h1,
+                    }
 
                 except Exception as e:
                     logger.debug(f"Failed to fetch metadata for {url}: {e}")
                     return None
 
         logger.info(f"Sampling metadata from {len(urls)} URLs...")
-        tasks = [fetch_meta(url) for url in urls]
-        fetched = await asyncio.gather(*tasks)
+        # One client for the whole sample so connections to the same host
+        # are reused instead of re-doing TCP/TLS setup per URL
+        async with httpx.AsyncClient(
+            timeout=Timeout(connect=3.0, read=self.fetch_timeout),
+            follow_redirects=True,
+            limits=Limits(max_connections=10)
+        ) as client:
+            tasks = [fetch_meta(client, url) for url in urls]
+            fetched = await asyncio.gather(*tasks)
 
         for result in fetched:
             if result:
@@ -583,24 +604,19 @@ class SmartClassifier:
                 continue
 
             score = scores[url]
-            title = meta.get("title", "").lower()
-            h1 = meta.get("h1", "").lower()
-            description = meta.get("description", "").lower()
-            combined = f"{title} {h1} {description}"
+            title = meta.get("title", "")
+            # Join first, then lowercase the combined text once
+            combined = f'{title} {meta.get("h1", "")} {meta.get("description", "")}'.lower()
 
             # Check for blog-like patterns
-            for pattern in BLOG_TITLE_PATTERNS:
-                if re.search(pattern, combined, re.IGNORECASE):
-                    score.blog_score += 0.3
-                    score.signals["blog_title_pattern"] = 0.3
-                    break
+            if _BLOG_TITLE_RE.search(combined):
+                score.blog_score += 0.3
+                score.signals["blog_title_pattern"] = 0.3
 
             # Check for tool-like patterns
-            for pattern in TOOL_TITLE_PATTERNS:
-                if re.search(pattern, combined, re.IGNORECASE):
-                    score.tool_score += 0.4
-                    score.signals["tool_title_pattern"] = 0.4
-                    break
+            if _TOOL_TITLE_RE.search(combined):
+                score.tool_score += 0.4
+                score.signals["tool_title_pattern"] = 0.4
 
             # Question-style title → likely blog
             if title.endswith("?"):
@@ -14,6 +14,11 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Slug cleanup patterns. Whitespace/underscore runs and hyphen runs are
+# collapsed in a single pass ("a - b" -> "a-b").
+_SLUG_INVALID_CHARS = re.compile(r'[^a-z0-9\s-]')
+_SLUG_SEPARATORS = re.compile(r'[\s_-]+')
+
 
 def generate_slug(keyword: str, max_length: int = 100) -> str:
     """
@@ -30,9 +35,8 @@ def generate_slug(keyword: str, max_length: int = 100) -> str:
         return "article"
 
     slug = keyword.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)  # remove special chars
-    slug = re.sub(r'[\s_]+', '-', slug)        # spaces/underscores to hyphens
-    slug = re.sub(r'-+', '-', slug)            # collapse multiple hyphens
+    slug = _SLUG_INVALID_CHARS.sub('', slug)   # remove special chars
+    slug = _SLUG_SEPARATORS.sub('-', slug)     # spaces/underscores/hyphen runs to one hyphen
     slug = slug.strip('-')
 
     # Handle empty result (e.g., keyword was only special chars like "!!!")
@@ -34,6 +34,7 @@ from opencontext import get_company_context
 from sitemap_crawler import crawl_sitemap
 from voice_enhancer import sample_and_enhance
 from constants import VOICE_ENHANCEMENT_SAMPLE_SIZE, VOICE_ENHANCEMENT_MIN_BLOGS
+from shared.json_utils import read_json, write_json
 
 # Configure logging
 logging.basicConfig(
@@ -185,16 +186,14 @@ async def run_from_file(input_path: str, output_path: Optional[str] = None) -> d
         Dictionary with Stage1Output fields
     """
     # Read input
-    with open(input_path, "r") as f:
-        input_json = json.load(f)
+    input_json = read_json(input_path)
 
     # Run
     result = await run_from_json(input_json)
 
     # Save output if path provided
     if output_path:
-        with open(output_path, "w") as f:
-            json.dump(result, f, indent=2)
+        write_json(output_path, result)
         logger.info(f"Output saved to {output_path}")
 
     return result
@@ -263,8 +262,7 @@ def main():
             result = output.model_dump()
 
             if args.output:
-                with open(args.output, "w") as f:
-                    json.dump(result, f, indent=2)
+                write_json(args.output, result)
                 logger.info(f"Output saved to {args.output}")
         else:
             parser.print_help()
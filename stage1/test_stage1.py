@@ -909,15 +909,13 @@ asyncio.run(run_integration_test())
 # Summary
 # =============================================================================
 
-print("\n" + "=" * 50)
-print(f"RESULTS: {PASSED} passed, {FAILED} failed")
-print("=" * 50)
+# Build the summary and emit it in one write
+summary = ["", "=" * 50, f"RESULTS: {PASSED} passed, {FAILED} failed", "=" * 50]
 
 if ERRORS:
-    print("\nFailures:")
-    for error in ERRORS:
-        print(f"  - {error}")
-    sys.exit(1)
+    summary.append("\nFailures:")
+    summary.extend(f"  - {error}" for error in ERRORS)
 else:
-    print("\nAll tests passed!")
-    sys.exit(0)
+    summary.append("\nAll tests passed!")
+print("\n".join(summary))
+sys.exit(1 if ERRORS else 0)
@@ -8,7 +8,6 @@ Uses Gemini's URL Context tool to fetch blog content directly.
 """
 
 import asyncio
-import json
 import logging
 import random
 import sys
@@ -444,6 +443,6 @@ if __name__ == "__main__":
 
         # Also dump full JSON for inspection
         print("\n📦 FULL JSON OUTPUT:")
-        print(json.dumps(enhanced.model_dump(), indent=2))
+        print(enhanced.model_dump_json(indent=2))
 
     asyncio.run(main())
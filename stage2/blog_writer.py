@@ -16,7 +16,7 @@ import asyncio
 import logging
 import os
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -81,7 +81,7 @@ FORMATTING:
 def get_system_instruction() -> str:
     """Get system instruction with current date injected."""
     template = _load_prompt("system_instruction.txt", _FALLBACK_SYSTEM)
-    current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    current_date = time.strftime("%Y-%m-%d", time.gmtime())
     try:
         return template.format(current_date=current_date)
     except KeyError as e:
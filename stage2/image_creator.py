@@ -87,7 +87,9 @@ async def generate_image(
             logger.error("No image_bytes in image data")
             return None
 
-        return _save_image(image_bytes, prompt, output_dir)
+        # WebP encoding and the file write block; keep them off the event
+        # loop, which is driving the article's Gemini call at the same time
+        return await asyncio.to_thread(_save_image, image_bytes, prompt, output_dir)
 
     except Exception as e:
         logger.error(f"Image generation failed: {e}")
@@ -10,6 +10,11 @@ from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Fluff words stripped from keywords (whole words only), fused into one pass
+_FLUFF_WORDS = re.compile(r'\b(?:Guide to|Complete)\b\s*', re.IGNORECASE)
+# Note: Only remove "A" and "An" at the START to avoid breaking "A/B Testing"
+_LEADING_ARTICLE = re.compile(r'^(The|A|An)\s+', re.IGNORECASE)
+
 
 def build_image_prompt(
     keyword: str,
@@ -39,13 +44,10 @@ def build_image_prompt(
     industry = company_data.get("industry", "") or "professional"
 
     # Clean keyword - remove common fluff words (only at word boundaries)
-    topic = keyword
     # Remove only whole words, not partial matches
-    # Note: Only remove "A" and "An" at the START to avoid breaking "A/B Testing"
-    for word in ["Guide to", "Complete"]:
-        topic = re.sub(rf'\b{re.escape(word)}\b\s*', '', topic, flags=re.IGNORECASE)
+    topic = _FLUFF_WORDS.sub('', keyword)
     # Remove articles only at the start of the string
-    topic = re.sub(r'^(The|A|An)\s+', '', topic, flags=re.IGNORECASE)
+    topic = _LEADING_ARTICLE.sub('', topic)
     topic = topic.strip()
     if not topic:
         topic = keyword.strip() or "professional business"
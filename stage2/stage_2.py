@@ -23,7 +23,6 @@ Usage:
 """
 
 import asyncio
-import json
 import logging
 import re
 import sys
@@ -45,6 +44,7 @@ if str(_parent) not in sys.path:
     sys.path.insert(0, str(_parent))
 
 from article_schema import ArticleOutput
+from shared.json_utils import read_json, write_json
 from blog_writer import BlogWriter
 from image_creator import ImageCreator
 from image_prompts import build_image_prompt
@@ -177,41 +177,20 @@ async def run_stage_2(input_data: Stage2Input) -> Stage2Output:
         raise ValueError(f"Cannot generate article: {e}") from e
     image_creator = ImageCreator() if not input_data.skip_images else None
 
-    # -----------------------------------------
-    # Step 1: Generate Article
-    # -----------------------------------------
-    logger.info("  Generating article with Gemini...")
-
-    article = await blog_writer.write_article(
-        keyword=input_data.keyword,
-        company_context=input_data.company_context.model_dump(),
-        word_count=input_data.word_count,
-        language=input_data.language,
-        country=input_data.country,
-        batch_instructions=input_data.custom_instructions,
-        keyword_instructions=input_data.keyword_instructions,
-    )
-    ai_calls += 1
-
-    logger.info(f"  Article generated: {article.Headline[:50]}...")
-    logger.info(f"  Sections: {article.count_sections()}, FAQs: {article.count_faqs()}")
-
-    # Validate video_url - clear if not a valid YouTube URL
-    if article.video_url:
-        if not YOUTUBE_URL_PATTERN.match(article.video_url):
-            logger.info(f"  Clearing invalid video_url: {article.video_url[:50]}...")
-            article.video_url = ""
-            article.video_title = ""
+    # Dump company context once; both the writer and image prompts only read it
+    company_data = input_data.company_context.model_dump()
 
     # -----------------------------------------
-    # Step 2: Generate Images (parallel)
+    # Step 1: Start Image Generation (parallel)
     # -----------------------------------------
-    images: List[ImageResult] = []
+    # Image prompts depend only on keyword, company and visual identity - not
+    # on the article text - so the images are generated while the article is
+    # being written instead of after it.
+    image_future: Optional[asyncio.Future] = None
 
     if not input_data.skip_images and image_creator:
         logger.info("  Generating 3 images in parallel...")
 
-        company_data = input_data.company_context.model_dump()
         visual_identity = input_data.visual_identity.model_dump() if input_data.visual_identity else None
 
         # Build prompts for all 3 positions (using visual identity from Stage 1)
@@ -235,12 +214,53 @@ async def run_stage_2(input_data: Stage2Input) -> Stage2Output:
                 )
                 return ImageResult(url="", alt_text="", position=position)
 
-        image_results = await asyncio.gather(
+        image_future = asyncio.gather(
             generate_single_image("hero", prompts["hero"]),
             generate_single_image("mid", prompts["mid"]),
             generate_single_image("bottom", prompts["bottom"]),
         )
 
+    # -----------------------------------------
+    # Step 2: Generate Article
+    # -----------------------------------------
+    logger.info("  Generating article with Gemini...")
+
+    try:
+        article = await blog_writer.write_article(
+            keyword=input_data.keyword,
+            company_context=company_data,
+            word_count=input_data.word_count,
+            language=input_data.language,
+            country=input_data.country,
+            batch_instructions=input_data.custom_instructions,
+            keyword_instructions=input_data.keyword_instructions,
+        )
+    except BaseException:
+        # No article means no output - don't leave image generation running
+        if image_future is not None:
+            image_future.cancel()
+            await asyncio.gather(image_future, return_exceptions=True)
+        raise
+    ai_calls += 1
+
+    logger.info(f"  Article generated: {article.Headline[:50]}...")
+    logger.info(f"  Sections: {article.count_sections()}, FAQs: {article.count_faqs()}")
+
+    # Validate video_url - clear if not a valid YouTube URL
+    if article.video_url:
+        if not YOUTUBE_URL_PATTERN.match(article.video_url):
+            logger.info(f"  Clearing invalid video_url: {article.video_url[:50]}...")
+            article.video_url = ""
+            article.video_title = ""
+
+    # -----------------------------------------
+    # Step 3: Collect Images
+    # -----------------------------------------
+    images: List[ImageResult] = []
+
+    if image_future is not None:
+        image_results = await image_future
+
         images = list(image_results)
         images_generated = sum(1 for img in images if img.url)
         ai_calls += images_generated  # Only count successful image generations
@@ -318,9 +338,8 @@ async def run_from_file(input_path: str, output_path: Optional[str] = None) -> d
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    # Read input with explicit encoding
-    with open(input_file, "r", encoding="utf-8") as f:
-        input_json = json.load(f)
+    # Read input (raw UTF-8 bytes, decoded by the JSON parser)
+    input_json = read_json(input_file)
 
     # Run
     result = await run_from_json(input_json)
@@ -330,8 +349,7 @@ async def run_from_file(input_path: str, output_path: Optional[str] = None) -> d
         # Resolve to absolute path (prevents some path traversal)
         output_file = Path(output_path).resolve()
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        write_json(output_file, result)
         logger.info(f"Output saved to {output_file}")
 
     return result
@@ -510,9 +528,8 @@ def main():
                 logger.error(f"Input file not found: {args.input}")
                 sys.exit(1)
 
-            # Read input file with explicit encoding
-            with open(args.input, "r", encoding="utf-8") as f:
-                input_json = json.load(f)
+            # Read input file
+            input_json = read_json(args.input)
 
             # Check if this is Stage 1 output (has articles list)
             if "articles" in input_json and args.keyword:
@@ -562,8 +579,7 @@ def main():
         if args.output:
             output_file = Path(args.output).resolve()
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            write_json(output_file, result)
             logger.info(f"Output saved to {output_file}")
 
         # Print summary
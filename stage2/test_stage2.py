@@ -411,6 +411,20 @@ def test_html_sanitizes_js_urls():
 
 test_html_sanitizes_js_urls()
 
+@test("HTML: removal does not splice dangerous tags back together")
+def test_html_sanitizes_spliced_tags():
+    payloads = [
+        '<ifr<script></script>ame src="//evil"></iframe>',
+        '<obj<style>x</style>ect data="evil.swf"></object>',
+        '<ba onx="y"se href="//evil/">',
+        '<me onx="y"ta http-equiv="refresh" content="0;url=//evil">',
+    ]
+    for payload in payloads:
+        sanitized = HTMLRenderer._sanitize_html(f"<p>Safe</p>{payload}")
+        assert sanitized == "<p>Safe</p>", f"{payload!r} -> {sanitized!r}"
+
+test_html_sanitizes_spliced_tags()
+
 @test("HTML: handles None source URL in dict")
 def test_html_none_source_url():
     article = {
@@ -534,6 +548,115 @@ def test_html_table_escaping():
 test_html_table_escaping()
 
 
+# =============================================================================
+# JSON Utils Tests (shared/json_utils.py)
+# =============================================================================
+
+print("\n=== Testing shared/json_utils.py ===")
+
+import tempfile
+from contextlib import contextmanager
+
+from shared import json_utils
+
+_JSON_SAMPLE = {
+    "Headline": "Größe & Qualität – 日本語 ✓",
+    "section_01_content": "<p>Line one\nLine two</p>",
+    "nested": {"items": [1, 2.5, True, None, "x"], "empty_dict": {}, "empty_list": []},
+}
+
+
+@contextmanager
+def _json_backend(use_orjson: bool):
+    """Force json_utils onto one backend for the duration of the block."""
+    saved = json_utils._ORJSON_AVAILABLE
+    json_utils._ORJSON_AVAILABLE = use_orjson and json_utils.orjson is not None
+    try:
+        yield
+    finally:
+        json_utils._ORJSON_AVAILABLE = saved
+
+
+_JSON_BACKENDS = [False, True] if json_utils.orjson is not None else [False]
+
+
+@test("JSON: orjson and stdlib pretty output are byte-identical")
+def test_json_backends_identical():
+    with _json_backend(False):
+        stdlib_bytes = json_utils.dumps(_JSON_SAMPLE)
+    with _json_backend(True):
+        fast_bytes = json_utils.dumps(_JSON_SAMPLE)
+    assert fast_bytes == stdlib_bytes, f"{fast_bytes!r} != {stdlib_bytes!r}"
+
+test_json_backends_identical()
+
+@test("JSON: orjson and stdlib compact output are byte-identical")
+def test_json_backends_identical_compact():
+    with _json_backend(False):
+        stdlib_bytes = json_utils.dumps(_JSON_SAMPLE, pretty=False)
+    with _json_backend(True):
+        fast_bytes = json_utils.dumps(_JSON_SAMPLE, pretty=False)
+    assert fast_bytes == stdlib_bytes, f"{fast_bytes!r} != {stdlib_bytes!r}"
+    assert b", " not in stdlib_bytes and b'": ' not in stdlib_bytes
+
+test_json_backends_identical_compact()
+
+@test("JSON: non-ASCII text is written as UTF-8, not escaped")
+def test_json_non_ascii():
+    for use_orjson in _JSON_BACKENDS:
+        with _json_backend(use_orjson):
+            encoded = json_utils.dumps(_JSON_SAMPLE)
+        assert "Größe & Qualität – 日本語 ✓".encode("utf-8") in encoded
+        assert b"\\u" not in encoded
+
+test_json_non_ascii()
+
+@test("JSON: write_json / read_json round-trip on both backends")
+def test_json_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        for use_orjson in _JSON_BACKENDS:
+            path = Path(tmp) / f"artifact_{use_orjson}.json"
+            with _json_backend(use_orjson):
+                json_utils.write_json(path, _JSON_SAMPLE)
+                assert json_utils.read_json(path) == _JSON_SAMPLE
+
+test_json_round_trip()
+
+@test("JSON: converts datetime, date, Path and set values")
+def test_json_conversions():
+    import datetime
+    payload = {
+        "created_at": datetime.datetime(2024, 5, 1, 12, 30, 0),
+        "day": datetime.date(2024, 5, 1),
+        "output_dir": Path("results") / "job",
+        "tags": {"seo"},
+    }
+    expected = {
+        "created_at": "2024-05-01T12:30:00",
+        "day": "2024-05-01",
+        "output_dir": str(Path("results") / "job"),
+        "tags": ["seo"],
+    }
+    for use_orjson in _JSON_BACKENDS:
+        with _json_backend(use_orjson):
+            assert json_utils.loads(json_utils.dumps(payload)) == expected
+
+test_json_conversions()
+
+@test("JSON: unsupported types raise TypeError instead of writing repr")
+def test_json_rejects_unknown_types():
+    for use_orjson in _JSON_BACKENDS:
+        with _json_backend(use_orjson):
+            try:
+                json_utils.dumps({"value": object()})
+            except TypeError as e:
+                assert "object is not JSON serializable" in str(e)
+            else:
+                raise AssertionError("expected TypeError")
+
+test_json_rejects_unknown_types()
+
+
 # =============================================================================
 # Image Creator Tests (image_creator.py)
 # =============================================================================
@@ -742,15 +865,13 @@ test_output_job_id()
 # Summary
 # =============================================================================
 
-print("\n" + "=" * 50)
-print(f"RESULTS: {PASSED} passed, {FAILED} failed")
-print("=" * 50)
+# Build the summary and emit it in one write
+summary = ["", "=" * 50, f"RESULTS: {PASSED} passed, {FAILED} failed", "=" * 50]
 
 if ERRORS:
-    print("\nFailures:")
-    for error in ERRORS:
-        print(f"  - {error}")
-    sys.exit(1)
+    summary.append("\nFailures:")
+    summary.extend(f"  - {error}" for error in ERRORS)
 else:
-    print("\nAll tests passed!")
-    sys.exit(0)
+    summary.append("\nAll tests passed!")
+print("\n".join(summary))
+sys.exit(1 if ERRORS else 0)
@@ -13,7 +13,6 @@ AI Calls: 1 (Gemini with structured schema, no grounding needed)
 """
 
 import asyncio
-import copy
 import json
 import logging
 import sys
@@ -30,20 +29,17 @@ try:
 except ImportError:
     from stage3_models import Stage3Input, Stage3Output, QualityFix, VoiceContext
 
-try:
-    from google.genai import types as genai_types
-except ImportError:
-    genai_types = None
-
 try:
     from shared.gemini_client import GeminiClient
     from shared.field_utils import iter_content_fields
+    from shared.json_utils import read_json, write_json
 except ImportError as e:
     # Can't use logger here as it's not configured yet
     import warnings
     warnings.warn(f"Could not import shared modules: {e}")
     GeminiClient = None
     iter_content_fields = None
+    read_json = write_json = None
 
 # Get logger (configuration done in main() for CLI usage)
 logger = logging.getLogger(__name__)
@@ -148,7 +144,11 @@ class QualityFixer:
         if cls._response_schema is not None:
             return cls._response_schema
 
-        if genai_types is None:
+        # Imported here, not at module load: google.genai.types is slow to
+        # import and is only needed once, when the schema is first built
+        try:
+            from google.genai import types as genai_types
+        except ImportError:
             raise ImportError("google-genai not installed")
 
         fix_schema = genai_types.Schema(
@@ -198,14 +198,16 @@ class QualityFixer:
         if not input_data.enabled:
             logger.info("  Stage disabled, skipping")
             return Stage3Output(
-                article=copy.deepcopy(input_data.article),
+                article=dict(input_data.article),
                 fixes_applied=0,
                 fixes=[],
                 ai_calls=0,
                 skipped=True,
             )
 
-        article = copy.deepcopy(input_data.article)
+        # Fixes only reassign top-level string fields, so a shallow copy
+        # keeps the input untouched without walking nested Sources/tables
+        article = dict(input_data.article)
 
         # Build content for Gemini review
         content_text = self._extract_content(article)
@@ -430,18 +432,19 @@ async def run_from_file(
 
     # Read input
     try:
-        with open(input_path, "r", encoding="utf-8") as f:
-            input_json = json.load(f)
+        input_json = read_json(input_file)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {input_path}: {e}") from e
 
-    # Handle different input formats (copy to avoid mutating caller's dict)
+    # Handle different input formats. input_json was just parsed from disk
+    # and nobody else holds it, so it is used as-is (run_stage_3 copies the
+    # article before fixing it)
     if "article" in input_json:
-        stage3_input = copy.deepcopy(input_json)
+        stage3_input = input_json
     else:
         # Wrap raw article output
         stage3_input = {
-            "article": copy.deepcopy(input_json),
+            "article": input_json,
             "keyword": input_json.get("primary_keyword", ""),
         }
 
@@ -462,8 +465,7 @@ async def run_from_file(
         if not output_file.parent.exists():
             output_file.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2)
+            write_json(output_file, result)
             logger.info(f"Output saved to {output_path}")
         except OSError as e:
             raise OSError(f"Failed to write {output_path}: {e}") from e
@@ -6,20 +6,50 @@ Cherry-picked and improved from existing stage-4 code.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
+import sys
+import tempfile
+import threading
 import time
-from typing import List, Tuple, Optional, Set
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
 
 import httpx
 
+# Add parent to path for shared imports
+_parent = Path(__file__).parent.parent
+if str(_parent) not in sys.path:
+    sys.path.insert(0, str(_parent))
+
+from shared.json_utils import dumps, read_json
+
 logger = logging.getLogger(__name__)
 
 # Default timeout can be overridden via environment variable
 DEFAULT_HTTP_TIMEOUT = float(os.getenv("HTTP_CHECK_TIMEOUT", "5.0"))
 DEFAULT_MAX_CONCURRENT = int(os.getenv("HTTP_CHECK_MAX_CONCURRENT", "10"))
 
+# Optional on-disk cache of alive URLs, shared across runs (disabled when unset)
+DEFAULT_CACHE_FILE = os.getenv("HTTP_CHECK_CACHE_FILE", "")
+DEFAULT_CACHE_TTL = float(os.getenv("HTTP_CHECK_CACHE_TTL", "86400"))
+
+# Serializes read-merge-write of cache files between checkers in this process
+_CACHE_WRITE_LOCK = threading.Lock()
+
+
+def _is_valid_cache_entry(entry) -> bool:
+    """Check a cache entry has the [status_code, final_url, expires_at] shape."""
+    return (
+        isinstance(entry, list)
+        and len(entry) == 3
+        and (entry[0] is None or type(entry[0]) is int)
+        and (entry[1] is None or isinstance(entry[1], str))
+        and type(entry[2]) in (int, float)
+    )
+
 
 @dataclass
 class HTTPCheckResult:
@@ -37,18 +67,21 @@ class HTTPChecker:
     Checks URL accessibility via HTTP requests.
 
     Features:
-    - Parallel async requests
+    - Parallel async requests over one pooled client per batch
     - HEAD first, fallback to GET
     - Follows redirects
     - Configurable timeout
     - Rate limiting
+    - Optional on-disk cache of alive URLs (HTTP_CHECK_CACHE_FILE)
     """
 
     def __init__(
         self,
         timeout: float = DEFAULT_HTTP_TIMEOUT,
         max_concurrent: int = DEFAULT_MAX_CONCURRENT,
-        user_agent: str = "OpenBlog-URLVerifier/1.0"
+        user_agent: str = "OpenBlog-URLVerifier/1.0",
+        cache_file: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
     ):
         """
         Initialize HTTP checker.
@@ -57,12 +90,21 @@ class HTTPChecker:
             timeout: Request timeout in seconds
             max_concurrent: Maximum concurrent requests
             user_agent: User-Agent header for requests
+            cache_file: JSON file caching alive URLs across runs
+                (default: HTTP_CHECK_CACHE_FILE; empty disables the cache)
+            cache_ttl: Seconds a cached result stays valid (default: 1 day)
         """
         self.timeout = timeout
         self.max_concurrent = max_concurrent
         self.user_agent = user_agent
         self._semaphore = asyncio.Semaphore(max_concurrent)
 
+        cache_file = DEFAULT_CACHE_FILE if cache_file is None else cache_file
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.cache_ttl = cache_ttl
+        # sha256(url) -> [status_code, final_url, expires_at]; loaded lazily
+        self._cache: Optional[Dict[str, list]] = None
+
     async def check_urls(self, urls: Set[str]) -> List[HTTPCheckResult]:
         """
         Check multiple URLs in parallel.
@@ -75,8 +117,30 @@ class HTTPChecker:
         """
         logger.info(f"Checking {len(urls)} URLs (max {self.max_concurrent} concurrent)")
 
-        tasks = [self._check_single(url) for url in urls]
-        results = await asyncio.gather(*tasks)
+        results = []
+        pending = list(urls)
+        if self.cache_file is not None:
+            if self._cache is None:
+                self._cache = await asyncio.to_thread(self._read_cache_file)
+            pending = []
+            for url in urls:
+                cached = self._cache_get(url)
+                if cached is not None:
+                    results.append(cached)
+                else:
+                    pending.append(url)
+            if results:
+                logger.info(f"Cache hits: {len(results)}, checking {len(pending)}")
+
+        if pending:
+            # One client for the whole batch: connections (and TLS sessions) to
+            # the same host are pooled and kept alive instead of re-opened per URL
+            async with self._make_client() as client:
+                tasks = [self._check_single(client, url) for url in pending]
+                checked = await asyncio.gather(*tasks)
+            results.extend(checked)
+            if self.cache_file is not None:
+                await asyncio.to_thread(self._cache_put, checked)
 
         alive = sum(1 for r in results if r.is_alive)
         dead = len(results) - alive
@@ -94,55 +158,124 @@ class HTTPChecker:
         Returns:
             HTTPCheckResult
         """
-        return await self._check_single(url)
+        async with self._make_client() as client:
+            return await self._check_single(client, url)
+
+    def _read_cache_file(self) -> Dict[str, list]:
+        """Read the on-disk cache; a missing or corrupt file reads as empty."""
+        try:
+            data = read_json(self.cache_file)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _cache_get(self, url: str) -> Optional[HTTPCheckResult]:
+        """Return a cached alive result for url, or None if missing/expired/malformed."""
+        entry = self._cache.get(hashlib.sha256(url.encode()).hexdigest())
+        if not _is_valid_cache_entry(entry) or entry[2] < time.time():
+            return None
+        return HTTPCheckResult(url=url, is_alive=True, status_code=entry[0], final_url=entry[1])
+
+    def _cache_put(self, results: List[HTTPCheckResult]) -> None:
+        """
+        Store alive results and persist the cache.
 
-    async def _check_single(self, url: str) -> HTTPCheckResult:
+        Dead URLs are never cached: a timeout or 5xx can be transient, and a
+        stale dead entry would make Stage 4 replace a working citation.
+        """
+        alive = [r for r in results if r.is_alive]
+        if not alive:
+            return
+        now = time.time()
+        expires_at = now + self.cache_ttl
+        fresh = {
+            hashlib.sha256(r.url.encode()).hexdigest(): [r.status_code, r.final_url, expires_at]
+            for r in alive
+        }
+
+        with _CACHE_WRITE_LOCK:
+            # Merge into the file as it is now, not the snapshot loaded at the
+            # start of the batch: other checkers (parallel articles) may have
+            # written entries since
+            cache = self._read_cache_file()
+            cache.update(fresh)
+            # Drop expired (and malformed) entries so the file doesn't grow without bound
+            for key in [k for k, v in cache.items() if not _is_valid_cache_entry(v) or v[2] < now]:
+                del cache[key]
+
+            tmp = None
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write a uniquely named temp file, then rename, so concurrent
+                # writers never share a temp file and readers never see a partial one
+                with tempfile.NamedTemporaryFile(
+                    dir=self.cache_file.parent, prefix=self.cache_file.name + ".",
+                    suffix=".tmp", delete=False,
+                ) as f:
+                    tmp = f.name
+                    f.write(dumps(cache, pretty=False))
+                os.replace(tmp, self.cache_file)
+            except OSError as e:
+                logger.warning(f"Failed to write URL cache {self.cache_file}: {e}")
+                if tmp is not None and os.path.exists(tmp):
+                    os.unlink(tmp)
+
+        self._cache = cache
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create the pooled client shared by one batch of checks."""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={"User-Agent": self.user_agent},
+            limits=httpx.Limits(max_connections=self.max_concurrent),
+        )
+
+    async def _check_single(self, client: httpx.AsyncClient, url: str) -> HTTPCheckResult:
         """Check a single URL with semaphore for rate limiting."""
         async with self._semaphore:
-            return await self._do_check(url)
+            return await self._do_check(client, url)
 
-    async def _do_check(self, url: str) -> HTTPCheckResult:
+    async def _do_check(self, client: httpx.AsyncClient, url: str) -> HTTPCheckResult:
         """
         Perform the actual HTTP check.
 
         Strategy:
         1. Try HEAD request (faster)
-        2. If HEAD fails with 405, try GET
+        2. If HEAD is rejected (405/501), try GET without reading the body
         3. Follow redirects and capture final URL
         """
-        start = time.monotonic()
+        start = time.perf_counter()
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                headers={"User-Agent": self.user_agent}
-            ) as client:
-                # Try HEAD first (faster, less bandwidth)
-                response = await client.head(url)
-
-                # Some servers reject HEAD with 405, try GET
-                if response.status_code == 405:
-                    response = await client.get(url)
-
-                elapsed = (time.monotonic() - start) * 1000
-
-                # Determine final URL after redirects
-                final_url = str(response.url) if response.url != url else None
-
-                # Consider 2xx and 3xx as alive
-                is_alive = response.status_code < 400
-
-                return HTTPCheckResult(
-                    url=url,
-                    is_alive=is_alive,
-                    status_code=response.status_code,
-                    final_url=final_url,
-                    response_time_ms=elapsed
-                )
+            # Try HEAD first (faster, less bandwidth)
+            response = await client.head(url)
+
+            # Some servers reject HEAD with 405/501, try GET. Only the status
+            # line and headers are needed, so the response is streamed and
+            # closed before any of the body is downloaded
+            if response.status_code in (405, 501):
+                async with client.stream("GET", url) as response:
+                    pass
+
+            elapsed = (time.perf_counter() - start) * 1000
+
+            # Determine final URL after redirects
+            final_url = str(response.url) if response.url != url else None
+
+            # Consider 2xx and 3xx as alive
+            is_alive = response.status_code < 400
+
+            return HTTPCheckResult(
+                url=url,
+                is_alive=is_alive,
+                status_code=response.status_code,
+                final_url=final_url,
+                response_time_ms=elapsed
+            )
 
         except httpx.TimeoutException:
-            elapsed = (time.monotonic() - start) * 1000
+            elapsed = (time.perf_counter() - start) * 1000
             return HTTPCheckResult(
                 url=url,
                 is_alive=False,
@@ -151,7 +284,7 @@ class HTTPChecker:
             )
 
         except httpx.ConnectError as e:
-            elapsed = (time.monotonic() - start) * 1000
+            elapsed = (time.perf_counter() - start) * 1000
             return HTTPCheckResult(
                 url=url,
                 is_alive=False,
@@ -160,7 +293,7 @@ class HTTPChecker:
             )
 
         except Exception as e:
-            elapsed = (time.monotonic() - start) * 1000
+            elapsed = (time.perf_counter() - start) * 1000
             return HTTPCheckResult(
                 url=url,
                 is_alive=False,
@@ -19,12 +19,10 @@ AI Calls: 0-2 (only if dead URLs found or content verification enabled)
 import argparse
 import asyncio
 import copy
-import json
 import logging
 import re
 from pathlib import Path
 from typing import Optional, Dict, Any, List
-from urllib.parse import urlparse
 
 from dotenv import load_dotenv
 
@@ -41,6 +39,7 @@ from stage4_models import (
 from url_extractor import URLExtractor
 from http_checker import HTTPChecker, HTTPCheckResult
 from url_verifier import URLVerifier
+from shared.json_utils import read_json, write_json
 
 # Configure logging
 logging.basicConfig(
@@ -54,6 +53,12 @@ logger = logging.getLogger(__name__)
 # URL Replacement Helpers
 # =============================================================================
 
+# Fixed patterns used by the per-link helpers (compiled once, not per call)
+_HREFLANG_ATTR = re.compile(r'hreflang=["\'][^"\']*["\']\s*')
+_HTML_TAG = re.compile(r'<[^>]+>')
+# End of the sentence around a link: '. ', '! ', '? ' or a closing </p>
+_SENTENCE_END = re.compile(r'[.!?] |</p>')
+
 def is_html_field(field_name: str) -> bool:
     """
     Check if a field contains HTML with anchor tags.
@@ -73,6 +78,10 @@ def replace_anchor_tag(content: str, old_url: str, new_url: str, anchor_text: st
 
     Handles nested tags like <a href="..."><strong>text</strong></a>
     """
+    # Cheap substring check before building and running the regex
+    if old_url not in content:
+        return content
+
     # Pattern to capture: <a, href="old_url", other attrs, >content</a>
     # Uses .*? to handle nested tags (non-greedy match to first </a>)
     pattern = rf'<a\s+([^>]*?)href=["\']({re.escape(old_url)})["\']([^>]*)>(.*?)</a>'
@@ -85,12 +94,12 @@ def replace_anchor_tag(content: str, old_url: str, new_url: str, anchor_text: st
         attrs = []
         if before_href:
             # Remove existing hreflang from before
-            before_href = re.sub(r'hreflang=["\'][^"\']*["\']\s*', '', before_href).strip()
+            before_href = _HREFLANG_ATTR.sub('', before_href).strip()
             if before_href:
                 attrs.append(before_href)
         if after_href:
             # Remove existing hreflang from after
-            after_href = re.sub(r'hreflang=["\'][^"\']*["\']\s*', '', after_href).strip()
+            after_href = _HREFLANG_ATTR.sub('', after_href).strip()
             if after_href:
                 attrs.append(after_href)
 
@@ -111,13 +120,16 @@ def remove_dead_link(content: str, dead_url: str) -> str:
     Before: <a href="https://dead-url.com" target="_blank"><strong>Some Text</strong></a>
     After:  Some Text
     """
+    if dead_url not in content:
+        return content
+
     # Match anchor with any nested content
     pattern = rf'<a\s+[^>]*href=["\']({re.escape(dead_url)})["\'][^>]*>(.*?)</a>'
 
     def strip_tags(match):
         inner = match.group(2)
         # Strip any nested HTML tags, keep text
-        return re.sub(r'<[^>]+>', '', inner)
+        return _HTML_TAG.sub('', inner)
 
     return re.sub(pattern, strip_tags, content, flags=re.IGNORECASE)
 
@@ -129,6 +141,9 @@ def extract_link_context(content: str, url: str) -> Dict[str, str]:
     Returns:
         Dict with 'sentence' and 'anchor_text' keys
     """
+    if url not in content:
+        return {"sentence": "", "anchor_text": ""}
+
     # Find the anchor tag with this URL
     anchor_pattern = rf'<a\s+[^>]*href=["\']({re.escape(url)})["\'][^>]*>(.*?)</a>'
     anchor_match = re.search(anchor_pattern, content, re.IGNORECASE | re.DOTALL)
@@ -138,7 +153,7 @@ def extract_link_context(content: str, url: str) -> Dict[str, str]:
 
     anchor_text = anchor_match.group(2)
     # Strip any nested HTML tags from anchor text
-    anchor_text = re.sub(r'<[^>]+>', '', anchor_text)
+    anchor_text = _HTML_TAG.sub('', anchor_text)
 
     # Find the sentence containing the anchor
     # Look for text between <p> tags or sentence boundaries
@@ -163,16 +178,17 @@ def extract_link_context(content: str, url: str) -> Dict[str, str]:
             0
         )
 
-        # Look forwards for sentence end
-        text_after = content[anchor_end:]
-        sentence_end_rel = min(
-            (text_after.find('. ') + 1) if text_after.find('. ') != -1 else len(text_after),
-            (text_after.find('! ') + 1) if text_after.find('! ') != -1 else len(text_after),
-            (text_after.find('? ') + 1) if text_after.find('? ') != -1 else len(text_after),
-            (text_after.find('</p>')) if text_after.find('</p>') != -1 else len(text_after),
-        )
+        # Look forwards for sentence end: the first boundary wins, so one
+        # search replaces four find() scans (keep the punctuation, not </p>)
+        end_match = _SENTENCE_END.search(content, anchor_end)
+        if end_match is None:
+            sentence_end = len(content)
+        elif end_match.group() == '</p>':
+            sentence_end = end_match.start()
+        else:
+            sentence_end = end_match.start() + 1
 
-        sentence = content[sentence_start:anchor_end + sentence_end_rel]
+        sentence = content[sentence_start:sentence_end]
 
     return {
         "sentence": sentence.strip(),
@@ -199,12 +215,15 @@ def replace_source_citation(content: Any, old_url: str, new_url: str, source_nam
         return result
 
     # Handle string format
-    if not isinstance(content, str):
+    if not isinstance(content, str) or old_url not in content:
         return content
 
     # First try [N]: format
     pattern = rf'(\[\d+\]:\s*){re.escape(old_url)}(\s*-\s*)[^\n]+'
-    result = re.sub(pattern, lambda m: f'{m.group(1)}{new_url}{m.group(2)}{source_name}', content)
+    # Backreference template instead of a Python callback, so the
+    # substitution is expanded in C (backslashes escaped to stay literal)
+    template = '\\g<1>' + new_url.replace('\\', '\\\\') + '\\g<2>' + source_name.replace('\\', '\\\\')
+    result = re.sub(pattern, template, content)
 
     # If no change, try plain URL replacement
     if result == content and old_url in content:
@@ -231,6 +250,8 @@ def remove_source_citation(content: Any, dead_url: str) -> Any:
     # Handle string format
     if not isinstance(content, str):
         return content
+    if dead_url not in content:
+        return content.strip()
 
     # Try [N]: format - remove entire line
     pattern = rf'\[\d+\]:\s*{re.escape(dead_url)}[^\n]*\n?'
@@ -250,11 +271,16 @@ def extract_anchor_context(content: str, url: str) -> str:
     Returns the full anchor tag with surrounding text for context.
     Handles nested tags like <a href="..."><strong>text</strong></a>
     """
-    # Try to find anchor tag with this URL (.*? handles nested tags)
-    pattern = rf'[^.]*<a\s+[^>]*href=["\']({re.escape(url)})["\'][^>]*>.*?</a>[^.]*\.'
-    match = re.search(pattern, content, flags=re.IGNORECASE)
-    if match:
-        return match.group(0).strip()
+    # Find the anchor tag with this URL (.*? handles nested tags), then widen
+    # to the surrounding sentence with rfind/find. A leading [^.]* in the
+    # regex would rescan the text from every start position (quadratic on
+    # long period-free paragraphs).
+    pattern = rf'<a\s+[^>]*href=["\']({re.escape(url)})["\'][^>]*>.*?</a>'
+    for match in re.finditer(pattern, content, flags=re.IGNORECASE):
+        sentence_end = content.find('.', match.end())
+        if sentence_end != -1:
+            sentence_start = content.rfind('.', 0, match.start()) + 1
+            return content[sentence_start:sentence_end + 1].strip()
 
     # Fallback: just return some context around the URL
     idx = content.find(url)
@@ -353,25 +379,22 @@ async def run_stage_4(input_data: Stage4Input) -> Stage4Output:
     # -----------------------------------------
     # Step 1: Extract URLs from article
     # -----------------------------------------
-    # Extract all URLs once, then filter for skip_domains
+    # Extract all URLs in one scan, then filter for skip_domains
+    # (the url -> fields map already holds every extracted URL as a key)
     extractor = URLExtractor(skip_domains=[])  # No skip filter for extraction
-    all_urls = extractor.extract_urls(article)
     all_url_field_map = extractor.get_url_field_map(article)
 
-    # Apply skip_domains filter (reuse URLExtractor's skip logic pattern)
-    skip_domains_set = set(d.lower() for d in input_data.skip_domains)
-
-    def should_skip_domain(url: str) -> bool:
-        try:
-            domain = urlparse(url).netloc.lower()
-            return any(domain == sd or domain.endswith("." + sd) for sd in skip_domains_set)
-        except Exception:
-            return False
-
-    urls = {url for url in all_urls if not should_skip_domain(url)}
-    url_field_map = {url: fields for url, fields in all_url_field_map.items() if url in urls}
-
-    skipped_count = len(all_urls) - len(urls)
+    # Apply skip_domains filter with URLExtractor's skip logic: one set lookup
+    # per domain suffix instead of testing every skip domain for each URL.
+    # Kept URLs and the skip count come out of the same single walk.
+    skip_filter = URLExtractor(skip_domains=input_data.skip_domains)
+    url_field_map: Dict[str, List[str]] = {}
+    for url, fields in all_url_field_map.items():
+        if not skip_filter.should_skip(url):
+            url_field_map[url] = fields
+    urls = set(url_field_map)
+
+    skipped_count = len(all_url_field_map) - len(url_field_map)
     logger.info(f"  Found {len(urls)} URLs to verify ({skipped_count} skipped)")
 
     if not urls:
@@ -417,6 +440,9 @@ async def run_stage_4(input_data: Stage4Input) -> Stage4Output:
                 error=http_result.error,
             ))
 
+    # Index results by URL once (URLs are unique) for the status updates below
+    url_result_map: Dict[str, URLVerificationResult] = {r.url: r for r in url_results}
+
     # -----------------------------------------
     # Step 3: Content verification (before replacements)
     # -----------------------------------------
@@ -438,13 +464,13 @@ async def run_stage_4(input_data: Stage4Input) -> Stage4Output:
 
             # Update results and collect irrelevant URLs
             for url, content_data in content_results.items():
-                for result in url_results:
-                    if result.url == url:
-                        result.content_relevant = content_data.get("content_relevant")
-                        result.content_summary = content_data.get("content_summary")
-                        if not content_data.get("content_relevant"):
-                            result.status = URLStatus.IRRELEVANT
-                            irrelevant_urls.append(url)
+                result = url_result_map.get(url)
+                if result:
+                    result.content_relevant = content_data.get("content_relevant")
+                    result.content_summary = content_data.get("content_summary")
+                    if not content_data.get("content_relevant"):
+                        result.status = URLStatus.IRRELEVANT
+                        irrelevant_urls.append(url)
 
             if irrelevant_urls:
                 logger.info(f"  Found {len(irrelevant_urls)} irrelevant URLs")
@@ -468,9 +494,11 @@ async def run_stage_4(input_data: Stage4Input) -> Stage4Output:
 
         try:
             # Build context map: url -> surrounding sentence
+            # Only look in the fields already known to contain each URL
             url_contexts = {}
             for url in urls_to_replace:
-                for field, content in article.items():
+                for field in url_field_map.get(url, []):
+                    content = article.get(field)
                     if isinstance(content, str) and url in content:
                         ctx = extract_anchor_context(content, url)
                         if ctx:
@@ -560,12 +588,12 @@ async def run_stage_4(input_data: Stage4Input) -> Stage4Output:
                         logger.info(f"    Replaced: {old_url[:50]}... -> {new_url[:50]}...")
 
                 # Update verification result
-                for result in url_results:
-                    if result.url == old_url:
-                        result.status = URLStatus.REPLACED
-                        result.replacement_url = new_url
-                        result.replacement_source = repl_data.get("source_name")
-                        result.replacement_reason = repl_data.get("reason")
+                result = url_result_map.get(old_url)
+                if result:
+                    result.status = URLStatus.REPLACED
+                    result.replacement_url = new_url
+                    result.replacement_source = repl_data.get("source_name")
+                    result.replacement_reason = repl_data.get("reason")
 
             logger.info(f"  Applied {len(replacements)} replacements")
 
@@ -687,9 +715,9 @@ async def run_stage_4(input_data: Stage4Input) -> Stage4Output:
 
             # Update verification results
             for bad_url in unreplaceable_urls:
-                for result in url_results:
-                    if result.url == bad_url:
-                        result.status = URLStatus.REMOVED
+                result = url_result_map.get(bad_url)
+                if result:
+                    result.status = URLStatus.REMOVED
 
     # -----------------------------------------
     # Build Output
@@ -748,16 +776,14 @@ async def run_from_file(input_path: str, output_path: Optional[str] = None) -> D
         Dictionary with Stage4Output fields
     """
     # Read input
-    with open(input_path, "r") as f:
-        input_json = json.load(f)
+    input_json = read_json(input_path)
 
     # Run
     result = await run_from_json(input_json)
 
     # Save output if path provided
     if output_path:
-        with open(output_path, "w") as f:
-            json.dump(result, f, indent=2)
+        write_json(output_path, result)
         logger.info(f"Output saved to {output_path}")
 
     return result
@@ -849,8 +875,7 @@ def main():
 
     async def run():
         # Read input file
-        with open(args.input, "r") as f:
-            input_json = json.load(f)
+        input_json = read_json(args.input)
 
         # Handle different input formats
         # Could be Stage4Input format or raw article output
@@ -885,8 +910,7 @@ def main():
 
         # Save output if path provided
         if args.output:
-            with open(args.output, "w") as f:
-                json.dump(result, f, indent=2)
+            write_json(args.output, result)
             logger.info(f"Output saved to {args.output}")
 
         # Print summary
@@ -59,6 +59,11 @@ class URLExtractor:
             skip_domains: Domains to exclude (e.g., image hosts)
         """
         self.skip_domains = set(skip_domains or [])
+        # Lowercased once so each check is a set lookup per domain suffix
+        self._skip_domains_lower = {d.lower() for d in self.skip_domains}
+        # URL -> skip decision; the same URL recurs across fields and
+        # across extract_* calls, so each is parsed only once
+        self._skip_cache: Dict[str, bool] = {}
 
     def _iter_content_fields(self, article: Dict[str, Any]):
         """Iterate over all string fields that may contain URLs."""
@@ -72,6 +77,10 @@ class URLExtractor:
 
     def _get_img_src_urls(self, content: str) -> Set[str]:
         """Extract URLs from img src attributes (to exclude from verification)."""
+        # Plain-text fields (FAQ/PAA answers, titles) have no tags at all;
+        # a memchr-speed '<' check skips the regex scan for them
+        if '<' not in content:
+            return set()
         return set(IMG_SRC_PATTERN.findall(content))
 
     def extract_urls(self, article: Dict[str, Any]) -> Set[str]:
@@ -93,7 +102,7 @@ class URLExtractor:
 
             for url in URL_PATTERN.findall(content):
                 cleaned = self._clean_url(url)
-                if cleaned and not self._should_skip(cleaned) and cleaned not in img_urls:
+                if cleaned and not self.should_skip(cleaned) and cleaned not in img_urls:
                     urls.add(cleaned)
 
         # Extract from Sources field (list of {title, url} dicts)
@@ -102,7 +111,7 @@ class URLExtractor:
             for source in sources:
                 if isinstance(source, dict):
                     url = source.get("url")
-                    if url and not self._should_skip(url):
+                    if url and not self.should_skip(url):
                         urls.add(url)
 
         logger.info(f"Extracted {len(urls)} unique URLs from article")
@@ -128,7 +137,7 @@ class URLExtractor:
             cleaned_urls = []
             for url in URL_PATTERN.findall(content):
                 cleaned = self._clean_url(url)
-                if cleaned and not self._should_skip(cleaned) and cleaned not in img_urls:
+                if cleaned and not self.should_skip(cleaned) and cleaned not in img_urls:
                     cleaned_urls.append(cleaned)
 
             if cleaned_urls:
@@ -141,7 +150,7 @@ class URLExtractor:
             for source in sources:
                 if isinstance(source, dict):
                     url = source.get("url")
-                    if url and not self._should_skip(url):
+                    if url and not self.should_skip(url):
                         source_urls.append(url)
             if source_urls:
                 field_urls["Sources"] = source_urls
@@ -170,7 +179,7 @@ class URLExtractor:
 
             for url in URL_PATTERN.findall(content):
                 cleaned = self._clean_url(url)
-                if cleaned and not self._should_skip(cleaned) and cleaned not in img_urls:
+                if cleaned and not self.should_skip(cleaned) and cleaned not in img_urls:
                     if cleaned not in url_fields:
                         url_fields[cleaned] = []
                     if field not in url_fields[cleaned]:
@@ -182,7 +191,7 @@ class URLExtractor:
             for source in sources:
                 if isinstance(source, dict):
                     url = source.get("url")
-                    if url and not self._should_skip(url):
+                    if url and not self.should_skip(url):
                         if url not in url_fields:
                             url_fields[url] = []
                         if "Sources" not in url_fields[url]:
@@ -200,24 +209,34 @@ class URLExtractor:
 
         return cleaned
 
-    def _should_skip(self, url: str) -> bool:
+    def should_skip(self, url: str) -> bool:
         """Check if URL should be skipped based on domain."""
         if not self.skip_domains:
             return False
 
+        cached = self._skip_cache.get(url)
+        if cached is not None:
+            return cached
+
+        skip = False
         try:
             parsed = urlparse(url)
             domain = parsed.netloc.lower()
 
-            # Check exact match and subdomain match
-            for skip_domain in self.skip_domains:
-                skip_domain = skip_domain.lower()
-                if domain == skip_domain or domain.endswith("." + skip_domain):
-                    return True
-
-            return False
+            # Check exact match and subdomain match: a.b.example.com is
+            # skipped if it or any parent (b.example.com, example.com, com)
+            # is in the skip set
+            skip_set = self._skip_domains_lower
+            while domain:
+                if domain in skip_set:
+                    skip = True
+                    break
+                _, _, domain = domain.partition(".")
         except Exception:
-            return False
+            skip = False
+
+        self._skip_cache[url] = skip
+        return skip
 
 
 def extract_urls(article: Dict[str, Any], skip_domains: List[str] = None) -> Set[str]:
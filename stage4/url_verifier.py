@@ -20,10 +20,8 @@ if str(_parent) not in sys.path:
 
 try:
     from shared.gemini_client import GeminiClient
-    from google.genai import types
 except ImportError:
     GeminiClient = None
-    types = None
 
 try:
     from shared.prompt_loader import load_prompt
@@ -128,6 +126,8 @@ class URLVerifier:
 
         try:
             # Build structured output schema
+            # Imported here, not at module load: google.genai.types is slow to import
+            from google.genai import types
             result_schema = types.Schema(
                 type=types.Type.OBJECT,
                 properties={
@@ -218,6 +218,7 @@ class URLVerifier:
 
         try:
             # Build structured output schema
+            from google.genai import types
             replacement_schema = types.Schema(
                 type=types.Type.OBJECT,
                 properties={
@@ -340,6 +341,7 @@ Rules:
 - Return the EXACT original sentence and the rewritten version"""
 
         try:
+            from google.genai import types
             rewrite_schema = types.Schema(
                 type=types.Type.OBJECT,
                 properties={
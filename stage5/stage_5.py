@@ -17,7 +17,6 @@ Output:
 """
 
 import asyncio
-import copy
 import json
 import logging
 import re
@@ -40,9 +39,11 @@ from stage5_models import Stage5Input, Stage5Output, LinkCandidate, LinkEmbeddin
 try:
     from shared.gemini_client import GeminiClient
     from shared.field_utils import iter_html_fields
+    from shared.json_utils import read_json
 except ImportError as e:
     GeminiClient = None
     iter_html_fields = None
+    read_json = None
     logger.warning(f"Stage 5 imports failed: {e}")
 
 # Lazy import for google.genai.types (thread-safe singleton)
@@ -135,7 +136,9 @@ class InternalLinker:
         if not input_data.article:
             raise ValueError("article cannot be empty")
 
-        article = copy.deepcopy(input_data.article)
+        # Links are inserted by reassigning top-level HTML fields, so a
+        # shallow copy is enough to leave the input article untouched
+        article = dict(input_data.article)
 
         # Build link pool
         link_pool = self._build_link_pool(input_data)
@@ -397,40 +400,44 @@ class InternalLinker:
     _NO_LINK_TAGS = ('a', 'button', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'code', 'pre',
                      'script', 'style', 'textarea', 'svg', 'label', 'option')
 
-    # Pre-compiled patterns for efficient tag matching
-    # Pattern matches: <tag> or <tag followed by whitespace/attributes
-    # This prevents <a from matching <aside, <article, etc.
-    _TAG_PATTERNS = {
-        tag: (re.compile(rf'<{tag}[>\s]', re.IGNORECASE), f'</{tag}>')
-        for tag in _NO_LINK_TAGS
-    }
-
-    def _is_position_protected(self, content: str, pos: int) -> bool:
+    # Opening or closing protected tag, matched in one pass over the text.
+    # An opening tag is <tag followed by > or whitespace, so <a does not
+    # match <aside, <article, etc. Group 1 = opened tag, group 2 = closed tag.
+    _PROTECTED_TAG_PATTERN = re.compile(
+        r'<(?:(' + '|'.join(_NO_LINK_TAGS) + r')(?=[>\s])|/(' + '|'.join(_NO_LINK_TAGS) + r')>)'
+    )
+
+    # Patterns used per candidate link (compiled once at class creation)
+    _HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+    _ANCHOR_TAG_PATTERN = re.compile(
+        r'^<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>(.+)</a>$',
+        re.IGNORECASE | re.DOTALL
+    )
+
+    def _is_position_protected(self, content_lower: str, pos: int) -> bool:
         """Check if a specific position is inside a protected tag.
 
-        Uses pre-compiled regex patterns for efficiency.
-        """
-        before = content[:pos].lower()
-
-        for open_pattern, close_tag in self._TAG_PATTERNS.values():
-            # Find last occurrence of opening tag pattern
-            last_open = -1
-            for m in open_pattern.finditer(before):
-                last_open = m.start()
-
-            if last_open == -1:
-                continue  # No opening tag found - skip
-
-            last_close = before.rfind(close_tag)
+        Walks every protected open/close tag before pos in a single regex
+        scan instead of two rfind scans per tag; a tag is protecting pos
+        when its last occurrence before pos is an opening tag.
 
-            if last_open > last_close:
-                return True
+        Args:
+            content_lower: Lowercased content (lowercased once by the caller)
+            pos: Offset into content_lower
+        """
+        open_tags = set()
+        for match in self._PROTECTED_TAG_PATTERN.finditer(content_lower, 0, pos):
+            opened, closed = match.groups()
+            if opened:
+                open_tags.add(opened)
+            else:
+                open_tags.discard(closed)
 
-        return False
+        return bool(open_tags)
 
     def _strip_html_tags(self, text: str) -> str:
         """Remove HTML tags from text, keeping only content."""
-        return re.sub(r'<[^>]+>', '', text)
+        return self._HTML_TAG_PATTERN.sub('', text)
 
     def _validate_replacement(self, find_text: str, replace_text: str, valid_urls: Set[str]) -> Optional[str]:
         """
@@ -450,11 +457,7 @@ class InternalLinker:
 
         # Validate <a> tag format - handle both quotes and href anywhere in tag
         # Pattern: <a ...href="url"... or <a ...href='url'...>content</a>
-        match = re.match(
-            r'^<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>(.+)</a>$',
-            replace_text,
-            re.IGNORECASE | re.DOTALL
-        )
+        match = self._ANCHOR_TAG_PATTERN.match(replace_text)
         if not match:
             logger.debug(f"  Invalid <a> tag format: {replace_text[:50]}...")
             return None
@@ -491,13 +494,24 @@ class InternalLinker:
         Returns:
             Position of first safe occurrence, or -1 if none found.
         """
+        # Lowercase once for every candidate position. A few characters
+        # (e.g. 'İ') lengthen when lowercased, which shifts offsets; only
+        # then fall back to lowercasing the prefix at each position.
+        content_lower = content.lower()
+        aligned = len(content_lower) == len(content)
+
         start = 0
         while True:
             pos = content.find(find_text, start)
             if pos == -1:
                 return -1
 
-            if not self._is_position_protected(content, pos):
+            if aligned:
+                protected = self._is_position_protected(content_lower, pos)
+            else:
+                before = content[:pos].lower()
+                protected = self._is_position_protected(before, len(before))
+            if not protected:
                 return pos
 
             start = pos + 1
@@ -597,8 +611,7 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         input_file = sys.argv[1]
         try:
-            with open(input_file, "r") as f:
-                test_input = json.load(f)
+            test_input = read_json(input_file)
             result = asyncio.run(run_stage_5(test_input))
             print(json.dumps(result, indent=2))
         except FileNotFoundError:
@@ -13,10 +13,10 @@ AI Calls: 1 (Gemini with Google Search grounding)
 """
 
 import asyncio
-import copy
 import json
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -30,19 +30,16 @@ try:
 except ImportError:
     from refresh_models import RefreshInput, RefreshOutput, RefreshFix
 
-try:
-    from google.genai import types as genai_types
-except ImportError:
-    genai_types = None
-
 try:
     from shared.gemini_client import GeminiClient
     from shared.field_utils import iter_content_fields
+    from shared.json_utils import read_json, write_json
 except ImportError as e:
     import warnings
     warnings.warn(f"Could not import shared modules: {e}")
     GeminiClient = None
     iter_content_fields = None
+    read_json = write_json = None
 
 logger = logging.getLogger(__name__)
 
@@ -60,8 +57,7 @@ except ImportError:
 
 def _get_refresh_prompt(content: str) -> str:
     """Load refresh prompt from file or use fallback."""
-    from datetime import date
-    today = date.today().strftime("%Y-%m-%d")
+    today = time.strftime("%Y-%m-%d")
 
     if _PROMPT_LOADER_AVAILABLE:
         try:
@@ -105,7 +101,11 @@ class ContentRefresher:
         if cls._response_schema is not None:
             return cls._response_schema
 
-        if genai_types is None:
+        # Imported here, not at module load: google.genai.types is slow to
+        # import and is only needed once, when the schema is first built
+        try:
+            from google.genai import types as genai_types
+        except ImportError:
             raise ImportError("google-genai not installed")
 
         fix_schema = genai_types.Schema(
@@ -154,14 +154,16 @@ class ContentRefresher:
         if not input_data.enabled:
             logger.info("  Stage disabled, skipping")
             return RefreshOutput(
-                article=copy.deepcopy(input_data.article),
+                article=dict(input_data.article),
                 fixes_applied=0,
                 fixes=[],
                 ai_calls=0,
                 skipped=True,
             )
 
-        article = copy.deepcopy(input_data.article)
+        # Fixes only reassign top-level string fields, so a shallow copy
+        # keeps the input untouched without walking nested values
+        article = dict(input_data.article)
 
         # Extract content for review
         content_text = self._extract_content(article)
@@ -356,17 +358,17 @@ async def run_from_file(
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
     try:
-        with open(input_path, "r", encoding="utf-8") as f:
-            input_json = json.load(f)
+        input_json = read_json(input_file)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in {input_path}: {e}") from e
 
-    # Handle different input formats
+    # Handle different input formats (input_json is freshly parsed and
+    # run_refresh copies the article itself, so no copy is needed here)
     if "article" in input_json:
-        refresh_input = copy.deepcopy(input_json)
+        refresh_input = input_json
     else:
         # Wrap raw content as article
-        refresh_input = {"article": copy.deepcopy(input_json)}
+        refresh_input = {"article": input_json}
 
     if disabled:
         refresh_input["enabled"] = False
@@ -378,8 +380,7 @@ async def run_from_file(
         if not output_file.parent.exists():
             output_file.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2)
+            write_json(output_file, result)
             logger.info(f"Output saved to {output_path}")
         except OSError as e:
             raise OSError(f"Failed to write {output_path}: {e}") from e
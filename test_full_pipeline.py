@@ -10,11 +10,13 @@ Tests the full pipeline with:
 
 Run: python test_full_pipeline.py
 Run without images: python test_full_pipeline.py --skip-images
+Run articles concurrently: python test_full_pipeline.py --parallel
 """
 
 import asyncio
-import json
+import io
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -29,11 +31,15 @@ load_dotenv(_BASE_PATH / ".env")
 
 # Parse args before importing heavy modules
 SKIP_IMAGES = "--skip-images" in sys.argv
+# Sequential by default for clearer log output; --parallel overlaps the
+# articles' Gemini round-trips (GeminiClient retries 429s with backoff)
+PARALLEL = "--parallel" in sys.argv
 
 
 async def run_test():
     """Run the full pipeline test."""
     from run_pipeline import run_pipeline
+    from shared.json_utils import write_json
 
     # Test configuration
     company_url = "https://www.hypofriend.de/"
@@ -55,6 +61,7 @@ async def run_test():
     print(f"Company URL: {company_url}")
     print(f"Language: {language} | Market: {market}")
     print(f"Skip Images: {SKIP_IMAGES}")
+    print(f"Parallel: {PARALLEL}")
     print(f"Keywords ({len(keywords)}):")
     for i, kw in enumerate(keywords, 1):
         print(f"  {i}. {kw}")
@@ -62,7 +69,7 @@ async def run_test():
     print("=" * 70)
     print()
 
-    start_time = datetime.now()
+    start = time.perf_counter()
 
     try:
         # Run the full pipeline
@@ -72,106 +79,111 @@ async def run_test():
             language=language,
             market=market,
             skip_images=SKIP_IMAGES,
-            max_parallel=1,  # Sequential for clearer test output
+            max_parallel=None if PARALLEL else 1,
             output_dir=output_dir,
             export_formats=["html", "markdown", "json"],
         )
 
+        duration = time.perf_counter() - start
         end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
 
-        # Save full results
         results_file = output_dir / f"test_results_{results['job_id']}.json"
-        with open(results_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        md_report = output_dir / "test_report.md"
 
-        # Print summary
-        print()
-        print("=" * 70)
-        print("TEST RESULTS")
-        print("=" * 70)
-        print(f"Job ID: {results['job_id']}")
-        print(f"Company: {results['company']}")
-        print(f"Duration: {duration:.1f}s")
-        print(f"Articles: {results['articles_successful']}/{results['articles_total']} successful")
-        print()
+        # Print summary (built in memory, written to stdout in one go)
+        summary = io.StringIO()
+        print(file=summary)
+        print("=" * 70, file=summary)
+        print("TEST RESULTS", file=summary)
+        print("=" * 70, file=summary)
+        print(f"Job ID: {results['job_id']}", file=summary)
+        print(f"Company: {results['company']}", file=summary)
+        print(f"Duration: {duration:.1f}s", file=summary)
+        print(f"Articles: {results['articles_successful']}/{results['articles_total']} successful", file=summary)
+        print(file=summary)
 
         # Per-article results
-        print("Article Results:")
-        print("-" * 70)
+        print("Article Results:", file=summary)
+        print("-" * 70, file=summary)
         for r in results["results"]:
             status = "OK" if r.get("article") and not r.get("error") else "FAILED"
-            print(f"  [{status}] {r['keyword']}")
+            print(f"  [{status}] {r['keyword']}", file=summary)
             if r.get("error"):
-                print(f"        Error: {r['error']}")
+                print(f"        Error: {r['error']}", file=summary)
             else:
                 # Show stage reports
                 for stage, report in r.get("reports", {}).items():
-                    print(f"        {stage}: {report}")
+                    print(f"        {stage}: {report}", file=summary)
                 # Show exported files
                 if r.get("exported_files"):
-                    print(f"        Exported: {list(r['exported_files'].keys())}")
+                    print(f"        Exported: {list(r['exported_files'].keys())}", file=summary)
+
+        sys.stdout.write(summary.getvalue())
+
+        # Build the markdown report in memory
+        parts = []
+        parts.append("# Full Pipeline Test Report\n\n")
+        parts.append(f"**Generated:** {end_time.isoformat()}\n\n")
+        parts.append(f"**Job ID:** `{results['job_id']}`\n\n")
+        parts.append(f"**Company:** {results['company']}\n\n")
+        parts.append(f"**Company URL:** {company_url}\n\n")
+        parts.append(f"**Language:** {language} | **Market:** {market}\n\n")
+        parts.append(f"**Duration:** {duration:.1f}s\n\n")
+        parts.append(f"**Skip Images:** {SKIP_IMAGES}\n\n")
+
+        parts.append("---\n\n## Keywords\n\n")
+        for i, kw in enumerate(keywords, 1):
+            parts.append(f"{i}. {kw}\n")
+
+        parts.append("\n---\n\n## Results Summary\n\n")
+        parts.append(f"| Metric | Value |\n")
+        parts.append(f"|--------|-------|\n")
+        parts.append(f"| Total Articles | {results['articles_total']} |\n")
+        parts.append(f"| Successful | {results['articles_successful']} |\n")
+        parts.append(f"| Failed | {results['articles_failed']} |\n")
+
+        parts.append("\n---\n\n## Article Details\n\n")
+        for r in results["results"]:
+            status = "PASS" if r.get("article") and not r.get("error") else "FAIL"
+            parts.append(f"### {r['keyword']}\n\n")
+            parts.append(f"**Status:** {status}\n\n")
+            parts.append(f"**Slug:** `{r['slug']}`\n\n")
+            parts.append(f"**Href:** `{r['href']}`\n\n")
+
+            if r.get("error"):
+                parts.append(f"**Error:** {r['error']}\n\n")
+            else:
+                parts.append("**Stage Reports:**\n\n")
+                parts.append("| Stage | Details |\n")
+                parts.append("|-------|---------|")
+                for stage, report in r.get("reports", {}).items():
+                    parts.append(f"\n| {stage} | {report} |")
+                parts.append("\n\n")
+
+                if r.get("article"):
+                    article = r["article"]
+                    parts.append(f"**Headline:** {article.get('Headline', 'N/A')}\n\n")
+                    meta_desc = article.get("MetaDescription", "")
+                    if meta_desc:
+                        parts.append(f"**Meta Description:** {meta_desc[:200]}...\n\n")
+
+                if r.get("exported_files"):
+                    parts.append("**Exported Files:**\n\n")
+                    for fmt, path in r["exported_files"].items():
+                        parts.append(f"- {fmt}: `{path}`\n")
+                    parts.append("\n")
+
+            parts.append("---\n\n")
+
+        # Write both artifacts together, off the event loop
+        await asyncio.gather(
+            asyncio.to_thread(write_json, results_file, results),
+            asyncio.to_thread(md_report.write_text, "".join(parts), encoding="utf-8"),
+        )
 
         print()
         print(f"Results saved to: {results_file}")
         print()
-
-        # Generate markdown report
-        md_report = output_dir / "test_report.md"
-        with open(md_report, "w", encoding="utf-8") as f:
-            f.write("# Full Pipeline Test Report\n\n")
-            f.write(f"**Generated:** {datetime.now().isoformat()}\n\n")
-            f.write(f"**Job ID:** `{results['job_id']}`\n\n")
-            f.write(f"**Company:** {results['company']}\n\n")
-            f.write(f"**Company URL:** {company_url}\n\n")
-            f.write(f"**Language:** {language} | **Market:** {market}\n\n")
-            f.write(f"**Duration:** {duration:.1f}s\n\n")
-            f.write(f"**Skip Images:** {SKIP_IMAGES}\n\n")
-
-            f.write("---\n\n## Keywords\n\n")
-            for i, kw in enumerate(keywords, 1):
-                f.write(f"{i}. {kw}\n")
-
-            f.write("\n---\n\n## Results Summary\n\n")
-            f.write(f"| Metric | Value |\n")
-            f.write(f"|--------|-------|\n")
-            f.write(f"| Total Articles | {results['articles_total']} |\n")
-            f.write(f"| Successful | {results['articles_successful']} |\n")
-            f.write(f"| Failed | {results['articles_failed']} |\n")
-
-            f.write("\n---\n\n## Article Details\n\n")
-            for r in results["results"]:
-                status = "PASS" if r.get("article") and not r.get("error") else "FAIL"
-                f.write(f"### {r['keyword']}\n\n")
-                f.write(f"**Status:** {status}\n\n")
-                f.write(f"**Slug:** `{r['slug']}`\n\n")
-                f.write(f"**Href:** `{r['href']}`\n\n")
-
-                if r.get("error"):
-                    f.write(f"**Error:** {r['error']}\n\n")
-                else:
-                    f.write("**Stage Reports:**\n\n")
-                    f.write("| Stage | Details |\n")
-                    f.write("|-------|---------|")
-                    for stage, report in r.get("reports", {}).items():
-                        f.write(f"\n| {stage} | {report} |")
-                    f.write("\n\n")
-
-                    if r.get("article"):
-                        article = r["article"]
-                        f.write(f"**Headline:** {article.get('Headline', 'N/A')}\n\n")
-                        meta_desc = article.get("MetaDescription", "")
-                        if meta_desc:
-                            f.write(f"**Meta Description:** {meta_desc[:200]}...\n\n")
-
-                    if r.get("exported_files"):
-                        f.write("**Exported Files:**\n\n")
-                        for fmt, path in r["exported_files"].items():
-                            f.write(f"- {fmt}: `{path}`\n")
-                        f.write("\n")
-
-                f.write("---\n\n")
-
         print(f"Markdown report: {md_report}")
 
         # Return success/failure